@@ -261,7 +261,7 @@ CREATE EXTERNAL TABLE dbo.fact_fsis_species (
     [Year] INT,
     Species NVARCHAR(100),
     RecallCount INT,
-    PoundsRecalled FLOAT  -- Nullable int in Pandas = float64
+    PoundsRecalled BIGINT  -- Nullable Int64 in Pandas = INT64 in Parquet
 )
 WITH (
     LOCATION = 'fact_fsis_species.parquet',
@@ -274,14 +274,14 @@ GO
 CREATE EXTERNAL TABLE dbo.fact_adverse_events (
     AdverseEventKey INT,
     ReportNumber NVARCHAR(50),
-    DateKey FLOAT,  -- Nullable INT in Pandas = float64
+    DateKey INT,  -- Nullable Int32 in Pandas = INT32 in Parquet
     [Year] INT,
     [Month] INT,
     IndustryCode NVARCHAR(20),
     IndustryCategory NVARCHAR(200),
     ProductType NVARCHAR(50),
     ProductName NVARCHAR(500),
-    ConsumerAge FLOAT,  -- Nullable int in Pandas = float64
+    ConsumerAge INT,  -- Nullable Int32 in Pandas = INT32 in Parquet
     ConsumerGender NVARCHAR(20),
     HasHospitalization BIT,
     HasEmergencyRoom BIT,
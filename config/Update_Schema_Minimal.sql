@@ -190,7 +190,7 @@ GO
 CREATE EXTERNAL TABLE dbo.fact_adverse_events (
     AdverseEventKey INT,
     ReportNumber NVARCHAR(50),
-    DateKey FLOAT,  -- Changed from INT to FLOAT (nullable int in Pandas = float64)
+    DateKey INT,  -- Nullable Int32 in Pandas = INT32 in Parquet
     [Year] INT,
     [Month] INT,
     IndustryCode NVARCHAR(20),
@@ -217,7 +217,7 @@ WITH (
 GO
 
 -- ============================================================================
--- STEP 8: Fix fact_fsis_species data type (BIGINT -> FLOAT for nullable PoundsRecalled)
+-- STEP 8: Fix fact_fsis_species data type (nullable Int64 PoundsRecalled -> BIGINT)
 -- ============================================================================
 PRINT 'Fixing fact_fsis_species...';
 IF OBJECT_ID('dbo.fact_fsis_species', 'U') IS NOT NULL
@@ -229,7 +229,7 @@ CREATE EXTERNAL TABLE dbo.fact_fsis_species (
     [Year] INT,
     Species NVARCHAR(100),
     RecallCount INT,
-    PoundsRecalled FLOAT  -- Changed from BIGINT to FLOAT (nullable int in Pandas = float64)
+    PoundsRecalled BIGINT  -- Nullable Int64 in Pandas = INT64 in Parquet
 )
 WITH (
     LOCATION = 'fact_fsis_species.parquet',
@@ -239,7 +239,7 @@ WITH (
 GO
 
 -- ============================================================================
--- STEP 9: Fix fact_adverse_events ConsumerAge (INT -> FLOAT for nullable)
+-- STEP 9: Fix fact_adverse_events ConsumerAge (nullable Int32 -> INT)
 -- ============================================================================
 PRINT 'Fixing fact_adverse_events ConsumerAge...';
 IF OBJECT_ID('dbo.fact_adverse_events', 'U') IS NOT NULL
@@ -249,14 +249,14 @@ GO
 CREATE EXTERNAL TABLE dbo.fact_adverse_events (
     AdverseEventKey INT,
     ReportNumber NVARCHAR(50),
-    DateKey FLOAT,  -- Nullable int in Pandas = float64
+    DateKey INT,  -- Nullable Int32 in Pandas = INT32 in Parquet
     [Year] INT,
     [Month] INT,
     IndustryCode NVARCHAR(20),
     IndustryCategory NVARCHAR(200),
     ProductType NVARCHAR(50),
     ProductName NVARCHAR(500),
-    ConsumerAge FLOAT,  -- Changed from INT to FLOAT (nullable int in Pandas = float64)
+    ConsumerAge INT,  -- Nullable Int32 in Pandas = INT32 in Parquet
     ConsumerGender NVARCHAR(20),
     HasHospitalization BIT,
     HasEmergencyRoom BIT,
@@ -1,5 +1,6 @@
 import json
 import os
+import random
 import smtplib
 import time
 from email.mime.multipart import MIMEMultipart
@@ -7,7 +8,7 @@ from email.mime.text import MIMEText
 from pathlib import Path
 from typing import List, Dict, Any
 
-from jinja2 import Environment, FileSystemLoader, TemplateNotFound
+from jinja2 import Environment, FileSystemBytecodeCache, FileSystemLoader, TemplateNotFound
 
 from utils.logger import setup_logger
 
@@ -31,6 +32,16 @@ class EmailService:
 
         self.config = self._load_config(config_path)
         self._setup_templates()
+        self._class1_recipients = self._validate_recipients(self.config['recipients']['class1_alerts'])
+
+        # Lazily opened SMTP connection, reused across sends until close()
+        self._smtp = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
 
     def _load_config(self, config_path: Path) -> Dict[str, Any]:
         """Load email configuration from JSON file."""
@@ -43,12 +54,25 @@ class EmailService:
             logger.error(f"Failed to load email config: {e}")
             raise
 
+    def _validate_recipients(self, recipients: List[str]) -> tuple:
+        """Keep only plausible email addresses, warning about the rest at startup."""
+        valid = tuple(r for r in recipients if '@' in r)
+        if len(valid) < len(recipients):
+            logger.warning(f"Ignoring {len(recipients) - len(valid)} invalid recipient(s) in email config")
+        return valid
+
     def _setup_templates(self):
-        """Setup Jinja2 template environment."""
+        """Setup Jinja2 template environment with bytecode caching under data/."""
         template_dir = Path(__file__).parent / "templates"
+        cache_dir = Path(__file__).parent.parent.parent / "data" / "cache" / "jinja"
+        cache_dir.mkdir(parents=True, exist_ok=True)
+
         self.jinja_env = Environment(
             loader=FileSystemLoader(template_dir),
-            autoescape=True
+            autoescape=True,
+            bytecode_cache=FileSystemBytecodeCache(directory=str(cache_dir)),
+            cache_size=32,
+            auto_reload=False  # Templates ship with the code, skip mtime checks
         )
 
     def _get_smtp_credentials(self) -> tuple:
@@ -60,6 +84,44 @@ class EmailService:
 
         return host, port, username, password
 
+    def _get_smtp(self) -> smtplib.SMTP:
+        """Return the cached SMTP connection, opening and authenticating it on first use."""
+        if self._smtp is None:
+            host, port, username, password = self._get_smtp_credentials()
+            server = smtplib.SMTP(host, port, timeout=30)
+            try:
+                if self.config['smtp']['use_tls']:
+                    server.starttls()
+
+                if password:
+                    server.login(username, password)
+            except Exception:
+                server.close()
+                raise
+
+            logger.debug(f"SMTP connection opened to {host}:{port}")
+            self._smtp = server
+        return self._smtp
+
+    def _discard_smtp(self):
+        """Drop the cached SMTP connection without a graceful QUIT."""
+        if self._smtp is not None:
+            try:
+                self._smtp.close()
+            finally:
+                self._smtp = None
+
+    def close(self):
+        """Close the cached SMTP connection, if any."""
+        if self._smtp is None:
+            return
+        try:
+            self._smtp.quit()
+        except (smtplib.SMTPException, OSError):
+            pass
+        finally:
+            self._discard_smtp()
+
     def _render_template(self, template_name: str, context: Dict[str, Any]) -> str:
         """Render a Jinja2 template with context."""
         try:
@@ -70,7 +132,7 @@ class EmailService:
             raise
 
     def _send_email(self, subject: str, html_body: str, text_body: str,
-                    recipients: List[str]) -> bool:
+                    recipients: tuple) -> bool:
         """
         Send an email with retry logic.
 
@@ -78,7 +140,7 @@ class EmailService:
             subject: Email subject
             html_body: HTML content
             text_body: Plain text content (fallback)
-            recipients: List of recipient email addresses
+            recipients: Pre-validated recipient email addresses
 
         Returns:
             True if email was sent successfully
@@ -87,52 +149,67 @@ class EmailService:
             logger.info("Notifications disabled in config")
             return True
 
-        valid_recipients = [r for r in recipients if '@' in r]
-        if not valid_recipients:
+        if not recipients:
             logger.warning("No valid recipients found")
             return False
 
-        host, port, username, password = self._get_smtp_credentials()
         max_retries = self.config['notification_settings']['max_retries']
+        deadline = time.monotonic() + self.config['notification_settings'].get('total_timeout_s', 60)
 
         msg = MIMEMultipart('alternative')
         msg['Subject'] = subject
         msg['From'] = f"{self.config['sender']['name']} <{self.config['sender']['email']}>"
-        msg['To'] = ', '.join(valid_recipients)
+        msg['To'] = ', '.join(recipients)
 
         # Attach plain text first, then HTML (email clients prefer last)
         msg.attach(MIMEText(text_body, 'plain', 'utf-8'))
         msg.attach(MIMEText(html_body, 'html', 'utf-8'))
 
+        # Serialize once, retries resend the same payload
+        payload = msg.as_string()
+
         for attempt in range(1, max_retries + 1):
             try:
                 logger.debug(f"SMTP connection attempt {attempt}/{max_retries}")
 
-                with smtplib.SMTP(host, port, timeout=30) as server:
-                    if self.config['smtp']['use_tls']:
-                        server.starttls()
-
-                    if password:
-                        server.login(username, password)
-
+                reused = self._smtp is not None
+                server = self._get_smtp()
+                try:
                     server.sendmail(
                         self.config['sender']['email'],
-                        valid_recipients,
-                        msg.as_string()
+                        recipients,
+                        payload
+                    )
+                except smtplib.SMTPServerDisconnected:
+                    if not reused:
+                        raise
+                    # The server dropped the idle cached connection, reconnect once
+                    logger.debug("Cached SMTP connection is stale, reconnecting")
+                    self._discard_smtp()
+                    self._get_smtp().sendmail(
+                        self.config['sender']['email'],
+                        recipients,
+                        payload
                     )
 
-                logger.info(f"Email sent successfully to {len(valid_recipients)} recipients")
+                logger.info(f"Email sent successfully to {len(recipients)} recipients")
                 return True
 
             except smtplib.SMTPAuthenticationError as e:
                 logger.error(f"SMTP authentication failed: {e}")
+                self._discard_smtp()
                 return False  # Don't retry auth errors
 
             except (smtplib.SMTPException, ConnectionError, TimeoutError) as e:
                 logger.warning(f"SMTP attempt {attempt} failed: {e}")
+                self._discard_smtp()
                 if attempt < max_retries:
-                    wait_time = 2 ** attempt  # Exponential backoff
-                    logger.info(f"Retrying in {wait_time} seconds...")
+                    # Capped exponential backoff with jitter, bounded by the total budget
+                    wait_time = min(2 ** attempt, 8) * (0.5 + random.random())
+                    if time.monotonic() + wait_time > deadline:
+                        logger.error(f"SMTP retry budget exhausted after {attempt} attempts")
+                        return False
+                    logger.info(f"Retrying in {wait_time:.1f} seconds...")
                     time.sleep(wait_time)
                 else:
                     logger.error(f"All {max_retries} SMTP attempts failed")
@@ -168,9 +245,7 @@ class EmailService:
             html_body = f"<pre>{text_body}</pre>"
 
         subject = f"[URGENT] {len(recalls)} New FDA Class I Recall(s) Detected"
-        recipients = self.config['recipients']['class1_alerts']
-
-        return self._send_email(subject, html_body, text_body, recipients)
+        return self._send_email(subject, html_body, text_body, self._class1_recipients)
 
     def _generate_fallback_text(self, recalls: List[Dict[str, Any]]) -> str:
         """Generate fallback plain text when templates are unavailable."""
@@ -1,7 +1,11 @@
-import json
+import os
 from pathlib import Path
-from typing import List
-import pandas as pd
+from typing import List, TYPE_CHECKING
+
+import orjson
+
+if TYPE_CHECKING:
+    import pandas as pd
 
 from utils.logger import setup_logger
 
@@ -16,46 +20,91 @@ class StateManager:
         Initialize StateManager.
 
         Args:
-            state_file: Path to state file. Defaults to state/notified_recalls.json
+            state_file: Path to state file. Defaults to state/notified_recalls.json.
+                Notified recalls are appended to a sibling .ndjson log; the JSON
+                file is only read to migrate state written by older versions.
         """
         if state_file is None:
             self.state_file = Path(__file__).parent.parent.parent / "state" / "notified_recalls.json"
         else:
             self.state_file = Path(state_file)
 
+        self.log_file = self.state_file.with_suffix('.ndjson')
         self.state_file.parent.mkdir(exist_ok=True)
+        self._log_entries = 0
+        self._log_corrupt = False
         self._notified_recalls: set = self._load_state()
 
+        # Migrate legacy JSON state into the log, drop duplicate entries or repair a torn line
+        migrate = self._notified_recalls and not self.log_file.exists()
+        if migrate or self._log_corrupt or self._log_entries > 2 * len(self._notified_recalls):
+            self.compact()
+
     def _load_state(self) -> set:
-        """Load notified recall numbers from state file."""
-        if not self.state_file.exists():
-            logger.info(f"State file not found, creating new: {self.state_file}")
-            return set()
+        """Load notified recall numbers from the legacy JSON file and the append-only log."""
+        notified = set()
+
+        if self.state_file.exists():
+            try:
+                data = orjson.loads(self.state_file.read_bytes())
+                notified.update(data.get('notified_recalls', []))
+            except orjson.JSONDecodeError as e:
+                logger.warning(f"State file corrupt, ignoring: {e}")
+            except Exception as e:
+                logger.error(f"Error loading state file: {e}")
+
+        if not self.log_file.exists():
+            if not notified:
+                logger.info(f"State log not found, creating new: {self.log_file}")
+            return notified
 
         try:
-            with open(self.state_file, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-                return set(data.get('notified_recalls', []))
-        except json.JSONDecodeError as e:
-            logger.warning(f"State file corrupt, reinitializing: {e}")
-            return set()
+            with open(self.log_file, 'rb') as f:
+                for line in f:
+                    line = line.strip()
+                    if not line:
+                        continue
+                    try:
+                        notified.add(orjson.loads(line))
+                        self._log_entries += 1
+                    except orjson.JSONDecodeError:
+                        # A torn last line from an interrupted append
+                        self._log_corrupt = True
+                        logger.warning(f"Skipping corrupt state log line: {line[:50]!r}")
         except Exception as e:
-            logger.error(f"Error loading state file: {e}")
-            return set()
+            logger.error(f"Error loading state log: {e}")
 
-    def _save_state(self) -> bool:
-        """Save notified recall numbers to state file."""
+        return notified
+
+    def _save_state(self, new_recalls: List[str]) -> bool:
+        """Append newly notified recall numbers to the state log."""
+        if not new_recalls:
+            return True
         try:
-            with open(self.state_file, 'w', encoding='utf-8') as f:
-                json.dump({
-                    'notified_recalls': list(self._notified_recalls)
-                }, f, indent=2)
+            with open(self.log_file, 'ab') as f:
+                f.write(b''.join(orjson.dumps(r) + b'\n' for r in new_recalls))
+            self._log_entries += len(new_recalls)
             return True
         except Exception as e:
-            logger.error(f"Error saving state file: {e}")
+            logger.error(f"Error saving state log: {e}")
             return False
 
-    def filter_new_class1_recalls(self, df: pd.DataFrame) -> pd.DataFrame:
+    def compact(self) -> bool:
+        """Rewrite the state log so it holds each notified recall number exactly once."""
+        tmp_file = self.log_file.with_suffix('.tmp')
+        try:
+            # Write a fresh copy and swap it in atomically, so a crash never truncates the log
+            with open(tmp_file, 'wb') as f:
+                f.write(b''.join(orjson.dumps(r) + b'\n' for r in sorted(self._notified_recalls)))
+            os.replace(tmp_file, self.log_file)
+            self._log_entries = len(self._notified_recalls)
+            logger.debug(f"State log compacted to {self._log_entries} entries")
+            return True
+        except Exception as e:
+            logger.error(f"Error compacting state log: {e}")
+            return False
+
+    def filter_new_class1_recalls(self, df: 'pd.DataFrame') -> 'pd.DataFrame':
         """
         Filter DataFrame for new Class I recalls that haven't been notified yet.
 
@@ -65,19 +114,29 @@ class StateManager:
         Returns:
             DataFrame containing only new Class I recalls
         """
+        # numpy/pandas are only needed here; keep them out of the import path of
+        # callers that only mark/check notification state
+        import numpy as np
+
         if df.empty:
             return df
 
-        # Filter for Class I recalls
-        class1_mask = df['classification'].str.upper() == 'CLASS I'
-        class1_df = df[class1_mask]
+        # Filter for Class I recalls - normalize only the distinct spellings, not every row
+        classification = df['classification']
+        class1_values = [v for v in classification.dropna().unique() if str(v).upper() == 'CLASS I']
+        class1_df = df[classification.isin(class1_values)]
 
         if class1_df.empty:
             logger.debug("No Class I recalls in dataset")
             return class1_df
 
-        # Filter out already notified recalls
-        new_mask = ~class1_df['recall_number'].isin(self._notified_recalls)
+        # Filter out already notified recalls (direct set probes, no Index construction)
+        notified = self._notified_recalls
+        new_mask = np.fromiter(
+            (r not in notified for r in class1_df['recall_number'].values),
+            dtype=bool,
+            count=len(class1_df)
+        )
         new_class1 = class1_df[new_mask].copy()
 
         logger.debug(f"Found {len(class1_df)} Class I recalls, {len(new_class1)} are new")
@@ -93,8 +152,9 @@ class StateManager:
         Returns:
             True if state was saved successfully
         """
-        self._notified_recalls.update(recall_numbers)
-        success = self._save_state()
+        new_recalls = [r for r in dict.fromkeys(recall_numbers) if r not in self._notified_recalls]
+        self._notified_recalls.update(new_recalls)
+        success = self._save_state(new_recalls)
 
         if success:
             logger.info(f"Marked {len(recall_numbers)} recalls as notified")
@@ -2,10 +2,9 @@
 Create fact_adverse_events table from FDA CAERS (Adverse Event Reporting System) data.
 Filters to food-related reports only (excludes cosmetics).
 """
-import json
+import ijson
 import pandas as pd
 from pathlib import Path
-from datetime import datetime
 
 # Setup paths
 PROJECT_ROOT = Path(__file__).parent.parent.parent
@@ -68,30 +67,41 @@ INDUSTRY_TO_PRODUCTTYPE = {
     'Macaroni/Noodle Prod': 'Processed',
 }
 
-def get_product_type(industry_category: str) -> str:
-    """Map FDA IndustryCategory to our ProductType."""
-    if not industry_category:
-        return 'Other'
-    return INDUSTRY_TO_PRODUCTTYPE.get(industry_category, 'Other')
-
-print("Loading FDA CAERS data...")
-with open(INPUT_FILE, 'r', encoding='utf-8') as f:
-    data = json.load(f)
+# CAERS outcome label -> boolean flag column
+OUTCOME_FLAGS = {
+    'HasHospitalization': 'Hospitalization',
+    'HasEmergencyRoom': 'Visited Emergency Room',
+    'HasDeath': 'Death',
+    'HasLifeThreatening': 'Life Threatening',
+    'HasDisability': 'Disability',
+    'HasAllergicReaction': 'Allergic Reaction',
+    'HasHealthcareVisit': 'Visited a Health Care Provider',
+}
 
-results = data['results']
-print(f"Total reports loaded: {len(results):,}")
+def iter_reports(path: Path):
+    """Yield CAERS reports one at a time instead of loading the whole JSON document."""
+    with open(path, 'rb') as f:
+        yield from ijson.items(f, 'results.item', use_float=True)
 
-# Load dim_date for DateKey lookup
-dim_date = pd.read_parquet(PROJECT_ROOT / 'data' / 'output' / 'parquet' / 'dim_date.parquet')
-date_lookup = dict(zip(dim_date['Date'].astype(str), dim_date['DateKey']))
+# Load the dim_date year range for DateKey validity (only the Year column)
+dim_date_years = pd.read_parquet(PROJECT_ROOT / 'data' / 'output' / 'parquet' / 'dim_date.parquet', columns=['Year'])['Year']
 
-print("Processing reports (filtering to food only)...")
+print("Streaming FDA CAERS reports (filtering to food only)...")
 
-records = []
-key = 1
+# Column-oriented accumulators (one list per output column) instead of a dict per report
+COLUMNS = [
+    'ReportNumber', 'IndustryCode', 'IndustryCategory', 'ProductName', 'ConsumerAge',
+    'ConsumerGender', 'ReactionCount', 'OutcomeCount'
+]
+columns = {name: [] for name in COLUMNS}
+outcome_lists = []  # Raw outcomes per report, turned into flag columns after the loop
+raw_dates = []  # Raw YYYYMMDD strings, parsed in one vectorized pass after the loop
 skipped_cosmetics = 0
+total_reports = 0
+
+for r in iter_reports(INPUT_FILE):
+    total_reports += 1
 
-for r in results:
     # Get first product info
     products = r.get('products', [])
     if not products:
@@ -105,23 +115,7 @@ for r in results:
         skipped_cosmetics += 1
         continue
 
-    # Parse date
-    date_str = r.get('date_created', '')
-    year = None
-    date_key = None
-
-    if date_str and len(date_str) >= 8:
-        try:
-            year = int(date_str[:4])
-            month = int(date_str[4:6])
-            day = int(date_str[6:8])
-            date_obj = datetime(year, month, day)
-            date_formatted = date_obj.strftime('%Y-%m-%d')
-            date_key = date_lookup.get(date_formatted)
-        except (ValueError, IndexError):
-            pass
-
-    # Extract outcomes as boolean flags
+    # Outcomes are expanded into boolean flags after the loop
     outcomes = r.get('outcomes', [])
 
     # Consumer info
@@ -147,37 +141,68 @@ for r in results:
     # Count reactions
     reactions = r.get('reactions', [])
 
-    record = {
-        'AdverseEventKey': key,
-        'ReportNumber': r.get('report_number'),
-        'DateKey': date_key,
-        'Year': year,
-        'Month': int(date_str[4:6]) if date_str and len(date_str) >= 6 else None,
-        'IndustryCode': product.get('industry_code'),
-        'IndustryCategory': industry_name,
-        'ProductType': get_product_type(industry_name),
-        'ProductName': product.get('name_brand'),
-        'ConsumerAge': int(age_years) if age_years and age_years > 0 else None,
-        'ConsumerGender': gender,
-        'HasHospitalization': 'Hospitalization' in outcomes,
-        'HasEmergencyRoom': 'Visited Emergency Room' in outcomes,
-        'HasDeath': 'Death' in outcomes,
-        'HasLifeThreatening': 'Life Threatening' in outcomes,
-        'HasDisability': 'Disability' in outcomes,
-        'HasAllergicReaction': 'Allergic Reaction' in outcomes,
-        'HasHealthcareVisit': 'Visited a Health Care Provider' in outcomes,
-        'ReactionCount': len(reactions),
-        'OutcomeCount': len(outcomes)
-    }
-
-    records.append(record)
-    key += 1
-
+    columns['ReportNumber'].append(r.get('report_number'))
+    raw_dates.append(r.get('date_created', ''))
+    columns['IndustryCode'].append(product.get('industry_code'))
+    columns['IndustryCategory'].append(industry_name)
+    columns['ProductName'].append(product.get('name_brand'))
+    columns['ConsumerAge'].append(int(age_years) if age_years and age_years > 0 else None)
+    columns['ConsumerGender'].append(gender)
+    columns['ReactionCount'].append(len(reactions))
+    columns['OutcomeCount'].append(len(outcomes))
+    outcome_lists.append(outcomes)
+
+print(f"Total reports loaded: {total_reports:,}")
 print(f"Skipped cosmetics: {skipped_cosmetics:,}")
-print(f"Food reports processed: {len(records):,}")
-
-# Create DataFrame
-df = pd.DataFrame(records)
+food_reports = len(columns['ReportNumber'])
+print(f"Food reports processed: {food_reports:,}")
+
+# Create DataFrame directly from the column lists
+df = pd.DataFrame({'AdverseEventKey': range(1, food_reports + 1), **columns})
+
+# Map FDA IndustryCategory -> our ProductType (unmapped or empty -> Other)
+df['ProductType'] = df['IndustryCategory'].map(INDUSTRY_TO_PRODUCTTYPE).fillna('Other')
+
+# Dates in one vectorized pass: YYYYMMDD -> Year/Month, valid dates -> DateKey
+date_strs = pd.Series(raw_dates, dtype=object).fillna('').astype(str)
+date_len = date_strs.str.len()
+df['Year'] = pd.to_numeric(date_strs.str[:4].where(date_len >= 8), errors='coerce')
+df['Month'] = pd.to_numeric(date_strs.str[4:6].where(date_len >= 6), errors='coerce')
+
+# DateKey is YYYYMMDD, so compute it from the parsed date instead of looking it up in
+# dim_date; dates outside the dim_date range get no key
+parsed_dates = pd.to_datetime(date_strs.str[:8].where(date_len >= 8), format='%Y%m%d', errors='coerce')
+in_dim_range = parsed_dates.dt.year.between(dim_date_years.min(), dim_date_years.max())
+df['DateKey'] = (
+    parsed_dates.dt.year * 10000 + parsed_dates.dt.month * 100 + parsed_dates.dt.day
+).where(in_dim_range)
+
+# Outcome flags in one vectorized pass: explode to one row per outcome, one-hot, fold back per report
+exploded = pd.Series(outcome_lists, dtype=object).explode()
+outcome_dummies = pd.get_dummies(exploded).groupby(level=0).max()
+for flag_col, outcome in OUTCOME_FLAGS.items():
+    if outcome in outcome_dummies.columns:
+        df[flag_col] = outcome_dummies[outcome].to_numpy(dtype=bool)
+    else:
+        df[flag_col] = False
+
+# Keep the original column order (flags before the counts)
+df = df[[
+    'AdverseEventKey', 'ReportNumber', 'DateKey', 'Year', 'Month', 'IndustryCode',
+    'IndustryCategory', 'ProductType', 'ProductName', 'ConsumerAge', 'ConsumerGender',
+    *OUTCOME_FLAGS, 'ReactionCount', 'OutcomeCount'
+]]
+
+# Narrow numeric columns to nullable Int32 (no float64 NaN promotion); written as Parquet INT32,
+# which the INT columns of the Synapse external table expect
+df = df.astype({
+    'DateKey': 'Int32',
+    'Year': 'Int32',
+    'Month': 'Int32',
+    'ConsumerAge': 'Int32',
+    'ReactionCount': 'Int32',
+    'OutcomeCount': 'Int32',
+})
 
 # Summary statistics
 print()
@@ -211,6 +236,8 @@ print("Gender Distribution:")
 print(df['ConsumerGender'].value_counts())
 print()
 
-# Save to parquet
-df.to_parquet(OUTPUT_FILE, index=False)
+# Save to parquet - low-cardinality text as categoricals so readers get them back as such
+for col in ['IndustryCategory', 'ProductType', 'ConsumerGender']:
+    df[col] = df[col].astype('category')
+df.to_parquet(OUTPUT_FILE, index=False, engine='pyarrow', compression='zstd', compression_level=3)
 print(f"Saved to {OUTPUT_FILE}")
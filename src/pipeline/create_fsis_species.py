@@ -4,6 +4,7 @@ Create fact_fsis_species table from FSIS species summary data.
 from azure.storage.blob import BlobServiceClient
 from dotenv import load_dotenv
 import os
+import numpy as np
 import pandas as pd
 from io import BytesIO
 from pathlib import Path
@@ -22,10 +23,12 @@ container = blob_service.get_container_client('raw')
 print("Creating fact_fsis_species...")
 print()
 
-# Download species file
+# Download species file straight into one buffer (parallel range GETs, no extra bytes copy)
 blob_client = container.get_blob_client('fsis/FSIS-Recall-Summary-species by year.xlsx')
-data = blob_client.download_blob().readall()
-df = pd.read_excel(BytesIO(data), header=None)
+buffer = BytesIO()
+blob_client.download_blob(max_concurrency=4).readinto(buffer)
+buffer.seek(0)
+df = pd.read_excel(buffer, header=None, engine='calamine')
 
 # Parse the data - it has two sections: Number of Recalls and Pounds Recalled
 years = [2012, 2013, 2014, 2015, 2016, 2017, 2018, 2019, 2020, 2021, 2022, 2023, 2024]
@@ -42,35 +45,26 @@ species_rows = {
     9: 'Turkey'
 }
 
-# Build the fact table
-records = []
-key = 1
-
-for year_idx, year in enumerate(years):
-    col_idx = year_idx + 1  # Column index (0 is species name, 1 is 2012, etc.)
-
-    for row_idx, species in species_rows.items():
-        recall_count = df.iloc[row_idx, col_idx]
+# Extract both sections as plain NumPy matrices (species x years) in one slice each
+# Pounds rows are 10 rows after the recalls rows (row 3 -> row 13, etc.); rows past the
+# end of the sheet come back as NaN via reindex
+recall_rows = list(species_rows)
+year_cols = range(1, len(years) + 1)  # Column 0 is the species name, 1 is 2012, etc.
+recalls_mat = df.reindex(index=recall_rows, columns=year_cols).to_numpy()
+pounds_mat = df.reindex(index=[r + 10 for r in recall_rows], columns=year_cols).to_numpy()
 
-        # Pounds row is 10 rows after recalls row (row 3 -> row 13, etc.)
-        pounds_row = row_idx + 10
-        pounds_recalled = df.iloc[pounds_row, col_idx] if pounds_row < len(df) else None
+# Flatten year-major (all species for 2012, then 2013, ...)
+recall_counts = pd.to_numeric(pd.Series(recalls_mat.T.ravel()), errors='coerce')
+pounds = pd.to_numeric(pd.Series(pounds_mat.T.ravel()), errors='coerce')
 
-        # Clean up values
-        recall_count = int(recall_count) if pd.notna(recall_count) else 0
-        pounds_recalled = int(pounds_recalled) if pd.notna(pounds_recalled) and pounds_recalled > 0 else None
-
-        records.append({
-            'FsisSpeciesKey': key,
-            'Year': year,
-            'Species': species,
-            'RecallCount': recall_count,
-            'PoundsRecalled': pounds_recalled
-        })
-        key += 1
-
-# Create DataFrame
-fact_fsis_species = pd.DataFrame(records)
+# Build the fact table
+fact_fsis_species = pd.DataFrame({
+    'FsisSpeciesKey': np.arange(1, recall_counts.size + 1),
+    'Year': np.repeat(years, len(species_rows)),
+    'Species': np.tile(list(species_rows.values()), len(years)),
+    'RecallCount': recall_counts.fillna(0).astype(int),
+    'PoundsRecalled': np.trunc(pounds.where(pounds > 0)).astype('Int64')
+})
 
 print("=== fact_fsis_species ===")
 print(f"Total rows: {len(fact_fsis_species)}")
@@ -7,6 +7,7 @@ from azure.storage.blob import BlobServiceClient
 from dotenv import load_dotenv
 import os
 import pandas as pd
+from concurrent.futures import ThreadPoolExecutor
 from io import BytesIO
 from pathlib import Path
 
@@ -29,11 +30,16 @@ fact_recalls = pd.read_parquet(PROJECT_ROOT / 'data' / 'output' / 'parquet' / 'f
 fact_recalls['Year'] = fact_recalls['DateKey'] // 10000
 
 # Aggregate by Year, Source AND Classification columns (count unique RecallIDs)
-yearly_from_recalls = fact_recalls.groupby([
-    'Year', 'Source', 'RecallCategory', 'RecallGroup', 'RecallSubgroup'
-]).agg(
-    RecallCount=('RecallID', 'nunique')
-).reset_index()
+# Dedup first, then a plain group size - avoids a per-group hash set from nunique()
+group_cols = ['Year', 'Source', 'RecallCategory', 'RecallGroup', 'RecallSubgroup']
+yearly_from_recalls = (
+    fact_recalls[group_cols + ['RecallID']]
+    .dropna(subset=['RecallID'])
+    .drop_duplicates()
+    .groupby(group_cols, observed=True)
+    .size()
+    .reset_index(name='RecallCount')
+)
 
 # Add placeholder for PoundsRecalled (not available for non-FSIS)
 yearly_from_recalls['PoundsRecalled'] = None
@@ -41,16 +47,34 @@ yearly_from_recalls['PoundsRecalled'] = None
 print(f"Aggregated {len(yearly_from_recalls)} rows from fact_recalls")
 
 # 2. Load FSIS Summary files for 2022-2024
-fsis_summaries = []
-for year in [2022, 2023, 2024]:
-    try:
-        blob_client = container.get_blob_client(f'fsis/FSIS-Recall-Summary-{year}.xlsx')
-        data = blob_client.download_blob().readall()
-        df = pd.read_excel(BytesIO(data), header=None)
-
-        for i, row in df.iterrows():
-            val = row[1]
-            if pd.notna(val) and isinstance(val, (int, float)) and val > 0:
+def download_fsis_summary(year: int) -> BytesIO:
+    """Download one FSIS yearly summary workbook into memory."""
+    blob_client = container.get_blob_client(f'fsis/FSIS-Recall-Summary-{year}.xlsx')
+    buffer = BytesIO()
+    blob_client.download_blob(max_concurrency=4).readinto(buffer)
+    buffer.seek(0)
+    return buffer
+
+def numeric_cells(column: pd.Series) -> pd.Series:
+    """Values of int/float cells, NaN for text (even text digits) and empty cells."""
+    return pd.to_numeric(column.where(column.map(type).isin((int, float))), errors='coerce')
+
+# Start all downloads at once, then parse in year order as they complete
+summary_years = [2022, 2023, 2024]
+with ThreadPoolExecutor(max_workers=len(summary_years)) as executor:
+    downloads = {year: executor.submit(download_fsis_summary, year) for year in summary_years}
+
+    fsis_summaries = []
+    for year in summary_years:
+        try:
+            df = pd.read_excel(downloads[year].result(), header=None, engine='calamine')
+
+            # Masks over the whole recalls/pounds columns instead of per-row isinstance checks;
+            # the first numeric cell > 0 holds the yearly total
+            recalls = numeric_cells(df.iloc[:, 1])
+            hits = (recalls > 0).to_numpy().nonzero()[0]
+            if len(hits):
+                val, pounds = recalls.iloc[hits[0]], numeric_cells(df.iloc[:, 2]).iloc[hits[0]]
                 fsis_summaries.append({
                     'Year': year,
                     'Source': 'FSIS',
@@ -58,12 +82,11 @@ for year in [2022, 2023, 2024]:
                     'RecallGroup': 'Summary Only',
                     'RecallSubgroup': 'Summary Only',
                     'RecallCount': int(val),
-                    'PoundsRecalled': int(row[2]) if pd.notna(row[2]) and isinstance(row[2], (int, float)) else None
+                    'PoundsRecalled': int(pounds) if pd.notna(pounds) else None
                 })
                 print(f"  FSIS {year}: {int(val)} recalls")
-                break
-    except Exception as e:
-        print(f"  Warning: Could not load FSIS {year}: {e}")
+        except Exception as e:
+            print(f"  Warning: Could not load FSIS {year}: {e}")
 
 fsis_df = pd.DataFrame(fsis_summaries)
 
@@ -87,7 +110,7 @@ print(f"Total rows: {len(combined)}")
 print()
 
 # Show summary by Year and Source (aggregated)
-year_source_totals = combined.groupby(['Year', 'Source'])['RecallCount'].sum().unstack(fill_value=0)
+year_source_totals = combined.groupby(['Year', 'Source'], observed=True)['RecallCount'].sum().unstack(fill_value=0)
 print("Recalls by Year and Source:")
 print(year_source_totals)
 print()
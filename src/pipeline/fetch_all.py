@@ -0,0 +1,41 @@
+"""
+Run the FSIS and CDC NORS fetchers concurrently
+
+Both fetchers spend almost all their time waiting on independent hosts
+(fsis.usda.gov, data.cdc.gov), so running them side by side brings a full
+ingest down to roughly the slower of the two. Each fetcher runs its whole
+main() in its own thread, so the FSIS blob upload also overlaps the CDC
+download instead of blocking it.
+"""
+from concurrent.futures import ThreadPoolExecutor
+
+import fetch_cdc_nors_data
+import fetch_fsis_data
+
+
+def main():
+    print("=" * 60)
+    print("Fetching FSIS and CDC NORS data concurrently")
+    print("=" * 60)
+
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        fsis_future = executor.submit(fetch_fsis_data.main)
+        cdc_future = executor.submit(fetch_cdc_nors_data.main)
+
+    exit_code = 0
+
+    if fsis_future.result() != 0:
+        print("✗ FSIS fetch failed")
+        exit_code = 1
+
+    try:
+        cdc_future.result()
+    except Exception as e:
+        print(f"✗ CDC NORS fetch failed: {e}")
+        exit_code = 1
+
+    return exit_code
+
+
+if __name__ == "__main__":
+    exit(main())
@@ -10,17 +10,25 @@ API Details:
 - Expected Records: ~12,000 (2012-2023)
 
 Output:
-- Local: data/input/json/cdc_nors_YYYY-MM-DD.json
+- Local: data/input/json/cdc_nors_YYYY-MM-DD.json (+ .parquet sibling)
 - Azure: raw/cdc/cdc_nors_YYYY-MM-DD.json (via ADF or manual upload)
 """
 
 import requests
-import json
+import ijson
+import orjson
+import sys
+import numpy as np
 import pandas as pd
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
 import logging
 
+# src/ on the path for the shared utils package (scripts run as python src/pipeline/...)
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from utils.http import create_session
+
 # Setup logging
 logging.basicConfig(
     level=logging.INFO,
@@ -33,65 +41,148 @@ CDC_NORS_API_URL = "https://data.cdc.gov/resource/5xkq-dg7x.json"
 OUTPUT_DIR = Path(__file__).parent.parent.parent / "data" / "input" / "json"
 MIN_YEAR = 2012
 BATCH_SIZE = 50000  # CDC API limit
+PAGE_SIZE = 5000  # Records per concurrent page request
+MAX_WORKERS = 4
+NUMERIC_COLUMNS = ['year', 'month', 'illnesses', 'hospitalizations', 'deaths']
+
+SESSION = create_session()
 
-def fetch_cdc_nors_data() -> pd.DataFrame:
+def _fetch_page(params: dict, offset: int) -> bytes:
+    """Fetch one page of records as raw JSON array bytes."""
+    page_params = {**params, "$limit": PAGE_SIZE, "$offset": offset}
+    response = SESSION.get(CDC_NORS_API_URL, params=page_params, timeout=120)
+    response.raise_for_status()
+    return response.content
+
+def fetch_cdc_nors_data(output_dir: Path) -> Path:
     """
-    Fetch CDC NORS outbreak data from the API.
+    Fetch CDC NORS outbreak data from the API and save the raw response.
+
+    Pages are requested concurrently and their record arrays are spliced
+    together as-is, so the output is the JSON records array downstream
+    loaders expect without being re-serialized.
+
+    Args:
+        output_dir: Directory for output file
 
     Returns:
-        DataFrame with outbreak records from 2012 onwards
+        Path to saved file with outbreak records from 2012 onwards
     """
     logger.info(f"Fetching CDC NORS data from {CDC_NORS_API_URL}")
 
-    # Query parameters - filter for years >= 2012
+    # Query parameters - filter for years >= 2012, :id keeps paging stable
     params = {
         "$where": f"year >= {MIN_YEAR}",
-        "$limit": BATCH_SIZE,
-        "$order": "year DESC"
+        "$order": "year DESC, :id"
     }
 
-    try:
-        response = requests.get(CDC_NORS_API_URL, params=params, timeout=120)
-        response.raise_for_status()
-
-        data = response.json()
-        df = pd.DataFrame(data)
-
-        logger.info(f"Fetched {len(df)} records")
+    output_dir.mkdir(parents=True, exist_ok=True)
 
-        if len(df) > 0:
-            # Log basic stats
-            if 'year' in df.columns:
-                logger.info(f"Year range: {df['year'].min()} - {df['year'].max()}")
-            logger.info(f"Columns: {df.columns.tolist()}")
+    timestamp = datetime.now().strftime("%Y-%m-%d")
+    filename = f"cdc_nors_{timestamp}.json"
+    filepath = output_dir / filename
+    # Pages are streamed into a temp file that only replaces the final one once every page arrived,
+    # so a failed run never leaves a truncated cdc_nors_*.json for load_cdc_data to pick up
+    tmp_path = filepath.with_name(filename + ".tmp")
 
-        return df
+    try:
+        # Count matching records first so all pages can be requested up front
+        response = SESSION.get(
+            CDC_NORS_API_URL,
+            params={"$where": params["$where"], "$select": "count(*) AS total"},
+            timeout=120
+        )
+        response.raise_for_status()
+        total = min(int(response.json()[0]['total']), BATCH_SIZE)
+        offsets = range(0, total, PAGE_SIZE)
+        logger.info(f"Fetching {total} records in {len(offsets)} pages")
+
+        with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor, open(tmp_path, 'wb') as f:
+            f.write(b'[')
+            first = True
+            # map() yields pages in offset order while later pages are still downloading
+            for page in executor.map(lambda offset: _fetch_page(params, offset), offsets):
+                records = page.strip()[1:-1].strip()
+                if records:
+                    if not first:
+                        f.write(b',\n')
+                    f.write(records)
+                    first = False
+            f.write(b']\n')
+        tmp_path.replace(filepath)
+
+        logger.info(f"Saved raw response to {filepath}")
+        return filepath
 
     except requests.RequestException as e:
         logger.error(f"API request failed: {e}")
         raise
 
-def save_to_json(df: pd.DataFrame, output_dir: Path) -> Path:
+    finally:
+        # Only still there if a page failed
+        tmp_path.unlink(missing_ok=True)
+
+def _flatten(record: dict, prefix: str = '') -> dict:
+    """Flatten nested objects (e.g. Socrata location fields) into dotted keys."""
+    flat = {}
+    for key, value in record.items():
+        if isinstance(value, dict):
+            flat.update(_flatten(value, f"{prefix}{key}."))
+        else:
+            flat[f"{prefix}{key}"] = value
+    return flat
+
+def load_records(filepath: Path) -> pd.DataFrame:
     """
-    Save DataFrame to JSON file with timestamp.
+    Load saved CDC NORS records for validation.
 
     Args:
-        df: DataFrame to save
-        output_dir: Directory for output file
+        filepath: Path to saved JSON records array
 
     Returns:
-        Path to saved file
+        DataFrame with outbreak records
     """
-    output_dir.mkdir(parents=True, exist_ok=True)
+    # pyarrow.json can't be used here: it only reads newline-delimited JSON and
+    # Socrata returns a single array, so parse records incrementally with ijson.
+    with open(filepath, 'rb') as f:
+        records = ijson.items(f, 'item', use_float=True)
+        # Only nested records pay for flattening; flat ones pass through untouched
+        df = pd.DataFrame.from_records(
+            _flatten(r) if any(isinstance(v, dict) for v in r.values()) else r
+            for r in records
+        )
+
+    logger.info(f"Fetched {len(df)} records")
+
+    if len(df) > 0:
+        # Log basic stats
+        if 'year' in df.columns:
+            logger.info(f"Year range: {df['year'].min()} - {df['year'].max()}")
+        logger.info(f"Columns: {df.columns.tolist()}")
 
-    timestamp = datetime.now().strftime("%Y-%m-%d")
-    filename = f"cdc_nors_{timestamp}.json"
-    filepath = output_dir / filename
+    return df
+
+def save_to_parquet(df: pd.DataFrame, json_path: Path) -> Path:
+    """
+    Save a typed Parquet sibling of the raw JSON for downstream stages.
+
+    Args:
+        df: DataFrame loaded from the raw JSON
+        json_path: Path of the saved raw JSON
+
+    Returns:
+        Path to saved Parquet file
+    """
+    filepath = json_path.with_suffix('.parquet')
 
-    # Save as JSON (records format for compatibility)
-    df.to_json(filepath, orient='records', indent=2, date_format='iso')
+    # Socrata delivers every value as a string; store the counts as integers
+    typed = df.copy()
+    for col in NUMERIC_COLUMNS:
+        if col in typed.columns:
+            typed[col] = pd.to_numeric(typed[col], errors='coerce').astype('Int32')
 
-    logger.info(f"Saved {len(df)} records to {filepath}")
+    typed.to_parquet(filepath, engine='pyarrow', compression='zstd', index=False)
+    logger.info(f"Saved {len(typed)} records to {filepath}")
     return filepath
 
 def validate_data(df: pd.DataFrame) -> dict:
@@ -104,9 +195,13 @@ def validate_data(df: pd.DataFrame) -> dict:
     Returns:
         Dictionary with validation results
     """
+    # Look up column names once
+    col_list = df.columns.tolist()
+    cols = set(col_list)
+
     validation = {
         "total_records": len(df),
-        "columns": df.columns.tolist(),
+        "columns": col_list,
         "year_range": None,
         "states_count": None,
         "has_illnesses": False,
@@ -114,31 +209,36 @@ def validate_data(df: pd.DataFrame) -> dict:
         "has_deaths": False
     }
 
-    if 'year' in df.columns:
+    if 'year' in cols:
+        # Years fit in Int16
+        year = pd.to_numeric(df['year'], errors='coerce').astype('Int16')
         validation["year_range"] = {
-            "min": int(df['year'].min()),
-            "max": int(df['year'].max())
+            "min": int(year.min()),
+            "max": int(year.max())
         }
 
-        # Year distribution
-        year_counts = df['year'].value_counts().sort_index()
-        validation["records_by_year"] = year_counts.to_dict()
+        # Year distribution: years span a small range, so bincount is a single pass
+        first_year = validation["year_range"]["min"]
+        counts = np.bincount(year.dropna().to_numpy(dtype=np.int16) - first_year)
+        validation["records_by_year"] = {
+            first_year + i: int(c) for i, c in enumerate(counts) if c
+        }
 
-    if 'state' in df.columns:
+    if 'state' in cols:
         validation["states_count"] = df['state'].nunique()
 
     # Check health impact columns
-    validation["has_illnesses"] = 'illnesses' in df.columns
-    validation["has_hospitalizations"] = 'hospitalizations' in df.columns
-    validation["has_deaths"] = 'deaths' in df.columns
-
-    # Summary stats for health impact
-    if validation["has_illnesses"]:
-        validation["total_illnesses"] = int(pd.to_numeric(df['illnesses'], errors='coerce').sum())
-    if validation["has_hospitalizations"]:
-        validation["total_hospitalizations"] = int(pd.to_numeric(df['hospitalizations'], errors='coerce').sum())
-    if validation["has_deaths"]:
-        validation["total_deaths"] = int(pd.to_numeric(df['deaths'], errors='coerce').sum())
+    validation["has_illnesses"] = 'illnesses' in cols
+    validation["has_hospitalizations"] = 'hospitalizations' in cols
+    validation["has_deaths"] = 'deaths' in cols
+
+    # Summary stats for health impact, converted to Int32 and summed together
+    num_cols = [c for c in ('illnesses', 'hospitalizations', 'deaths') if c in cols]
+    if num_cols:
+        nums = df[num_cols].apply(lambda s: pd.to_numeric(s, errors='coerce').astype('Int32'))
+        totals = nums.sum()
+        for col, total in totals.items():
+            validation[f"total_{col}"] = int(total)
 
     return validation
 
@@ -149,10 +249,12 @@ def main():
     logger.info("=" * 60)
 
     # Fetch data
-    df = fetch_cdc_nors_data()
+    output_path = fetch_cdc_nors_data(OUTPUT_DIR)
+    df = load_records(output_path)
 
     if df.empty:
         logger.warning("No data fetched from CDC API")
+        output_path.unlink()
         return
 
     # Validate
@@ -169,13 +271,14 @@ def main():
     if validation.get('has_deaths'):
         logger.info(f"  Total Deaths: {validation.get('total_deaths', 0):,}")
 
-    # Save to JSON
-    output_path = save_to_json(df, OUTPUT_DIR)
+    # Typed Parquet copy so downstream stages don't re-parse the JSON
+    save_to_parquet(df, output_path)
 
     # Also save validation results
     validation_path = OUTPUT_DIR / "cdc_nors_validation.json"
-    with open(validation_path, 'w') as f:
-        json.dump(validation, f, indent=2)
+    validation_path.write_bytes(
+        orjson.dumps(validation, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    )
     logger.info(f"Validation results saved to {validation_path}")
 
     logger.info("\n" + "=" * 60)
@@ -185,7 +288,7 @@ def main():
 
     # Print sample columns for mapping reference
     logger.info("\nAvailable columns for Star Schema mapping:")
-    for col in sorted(df.columns):
+    for col in sorted(validation['columns']):
         logger.info(f"  - {col}")
 
     return df
@@ -1,13 +1,23 @@
 """
 Fetch FSIS recall data from API and upload to Azure Blob Storage
 """
+import gzip
 import os
+import sys
 import requests
-import json
-import time
-from azure.storage.blob import BlobServiceClient
+import ijson
+import orjson
+from functools import lru_cache
+from io import BytesIO
+from pathlib import Path
+from urllib3.exceptions import HTTPError as Urllib3HTTPError
+from azure.storage.blob import BlobServiceClient, ContentSettings
 from dotenv import load_dotenv
 
+# src/ on the path for the shared utils package (scripts run as python src/pipeline/...)
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from utils.http import create_session
+
 load_dotenv()
 
 # Config
@@ -15,8 +25,10 @@ FSIS_API_URL = "https://www.fsis.usda.gov/fsis/api/recall/v/1"
 STORAGE_ACCOUNT_NAME = os.getenv("AZURE_STORAGE_ACCOUNT_NAME")
 STORAGE_ACCOUNT_KEY = os.getenv("AZURE_STORAGE_ACCOUNT_KEY")
 CONTAINER_NAME = os.getenv("AZURE_CONTAINER_NAME", "raw")
-CONNECTION_STRING = f"DefaultEndpointsProtocol=https;AccountName={STORAGE_ACCOUNT_NAME};AccountKey={STORAGE_ACCOUNT_KEY};EndpointSuffix=core.windows.net"
-OUTPUT_BLOB_NAME = "fsis_recalls.json"
+ACCOUNT_URL = f"https://{STORAGE_ACCOUNT_NAME}.blob.core.windows.net"
+OUTPUT_BLOB_NAME = "fsis_recalls.json.gz"
+
+SESSION = create_session()
 
 def fetch_fsis_data():
     """Fetch FSIS recall data from API with retry logic"""
@@ -29,45 +41,47 @@ def fetch_fsis_data():
         'Accept': 'application/json'
     }
     
-    # Retry logic: 3 attempts with increasing backoff
-    max_attempts = 3
+    # Retries with backoff are handled by the session's HTTPAdapter
     timeout = 90  # Increased timeout for slow API
     
-    for attempt in range(1, max_attempts + 1):
-        try:
-            print(f"Attempt {attempt}/{max_attempts}...")
-            response = requests.get(FSIS_API_URL, headers=headers, timeout=timeout)
+    try:
+        # Stream the body and parse records as they arrive instead of buffering it
+        with SESSION.get(FSIS_API_URL, headers=headers, stream=True, timeout=timeout) as response:
             response.raise_for_status()
-            
-            data = response.json()
-            print(f"✓ Successfully fetched {len(data)} FSIS recall records")
-            return data
-            
-        except requests.exceptions.Timeout:
-            print(f"✗ Request timed out (>{timeout} seconds)")
-            if attempt < max_attempts:
-                wait_time = 5 * attempt
-                print(f"  Retrying in {wait_time} seconds...")
-                time.sleep(wait_time)
-            else:
-                print("✗ All retry attempts exhausted")
-                return None
-                
-        except requests.exceptions.RequestException as e:
-            print(f"✗ Error fetching FSIS data: {e}")
-            if attempt < max_attempts:
-                wait_time = 5 * attempt
-                print(f"  Retrying in {wait_time} seconds...")
-                time.sleep(wait_time)
-            else:
-                print("✗ All retry attempts exhausted")
-                return None
-                
-        except json.JSONDecodeError as e:
-            print(f"✗ Error parsing JSON response: {e}")
-            return None
-    
-    return None
+            response.raw.decode_content = True
+            data = list(ijson.items(response.raw, 'item', use_float=True))
+        print(f"✓ Successfully fetched {len(data)} FSIS recall records")
+        return data
+        
+    except requests.exceptions.Timeout:
+        print(f"✗ Request timed out (>{timeout} seconds)")
+        return None
+        
+    except (requests.exceptions.RequestException, Urllib3HTTPError) as e:
+        print(f"✗ Error fetching FSIS data (retries exhausted): {e}")
+        return None
+        
+    except ijson.JSONError as e:
+        print(f"✗ Error parsing JSON response: {e}")
+        return None
+
+@lru_cache(maxsize=1)
+def _blob_service():
+    """Shared BlobServiceClient so repeated uploads reuse one HTTP pool"""
+    if STORAGE_ACCOUNT_KEY:
+        credential = {"account_name": STORAGE_ACCOUNT_NAME, "account_key": STORAGE_ACCOUNT_KEY}
+    else:
+        # No key configured: use managed identity / az login (needs azure-identity)
+        from azure.identity import DefaultAzureCredential
+        credential = DefaultAzureCredential()
+
+    # Payloads above max_single_put_size are split into blocks uploaded in parallel
+    return BlobServiceClient(
+        account_url=ACCOUNT_URL,
+        credential=credential,
+        max_block_size=4 * 1024 * 1024,
+        max_single_put_size=8 * 1024 * 1024
+    )
 
 def upload_to_azure(data):
     """Upload FSIS data to Azure Blob Storage"""
@@ -77,16 +91,22 @@ def upload_to_azure(data):
     
     try:
         # Connect to Azure
-        blob_service_client = BlobServiceClient.from_connection_string(CONNECTION_STRING)
-        container_client = blob_service_client.get_container_client(CONTAINER_NAME)
-        blob_client = container_client.get_blob_client(OUTPUT_BLOB_NAME)
+        blob_client = _blob_service().get_blob_client(CONTAINER_NAME, OUTPUT_BLOB_NAME)
         
-        # Convert to JSON string
-        json_data = json.dumps(data, indent=2)
+        # Serialize straight to bytes and gzip (repeated keys compress well)
+        json_bytes = orjson.dumps(data)
+        payload = gzip.compress(json_bytes, compresslevel=6)
         
         # Upload
-        blob_client.upload_blob(json_data, overwrite=True)
-        print(f"✓ Successfully uploaded {len(json_data)} bytes to Azure")
+        buf = BytesIO(payload)
+        blob_client.upload_blob(
+            buf,
+            overwrite=True,
+            length=len(payload),
+            max_concurrency=4,
+            content_settings=ContentSettings(content_type='application/json', content_encoding='gzip')
+        )
+        print(f"✓ Successfully uploaded {len(payload)} bytes to Azure ({len(json_bytes)} uncompressed)")
         return True
         
     except Exception as e:
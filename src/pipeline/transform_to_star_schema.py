@@ -22,12 +22,21 @@ Output (Gold Layer):
 
 import pandas as pd
 import numpy as np
-import json
+import calendar
+import functools
+import hashlib
+import itertools
+import orjson
 import re
-from datetime import datetime
 from pathlib import Path
 import logging
-from typing import Tuple, Optional
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Dict, Tuple, Optional
+
+try:
+    import ijson
+except ImportError:  # fall back to loading the whole CDC file
+    ijson = None
 
 # Setup logging
 logging.basicConfig(
@@ -39,6 +48,7 @@ logger = logging.getLogger(__name__)
 # Configuration
 PROJECT_ROOT = Path(__file__).parent.parent.parent
 OUTPUT_DIR = PROJECT_ROOT / "data" / "output" / "parquet"
+CACHE_DIR = PROJECT_ROOT / "data" / "cache"
 
 # Data source paths
 FDA_JSON_PATH = PROJECT_ROOT / "data" / "input" / "fda-data-usa" / "food-enforcement-0001-of-0001.json"
@@ -47,6 +57,15 @@ CDC_JSON_DIR = PROJECT_ROOT / "data" / "input" / "json"
 RASFF_DIR = PROJECT_ROOT / "data" / "input" / "rasff-data-europe"
 UK_FSA_JSON_PATH = PROJECT_ROOT / "data" / "input" / "json" / "uk_fsa_alerts_2019-2026.json"
 
+# Low-cardinality text columns stored as categoricals after loading
+CATEGORY_COLUMNS = (
+    'classification', 'class', 'notifying_country', 'origin', 'hazard_category',
+    'type', 'state', 'country', 'species', 'alert_type'
+)
+
+# RASFF hazards text: "Listeria monocytogenes - {pathogenic micro-organisms}"
+HAZARD_PATTERN = re.compile(r'^(?P<substance>.+?)\s*-\s*\{(?P<hazard_category>.+?)\}')
+
 # EU Country mappings (for harmonization)
 EU_MEMBERS = {
     'Austria', 'Belgium', 'Bulgaria', 'Croatia', 'Cyprus', 'Czech Republic', 'Czechia',
@@ -77,12 +96,79 @@ COUNTRY_NAME_MAP = {
 }
 
 
+def categorize_columns(df: pd.DataFrame) -> pd.DataFrame:
+    """Convert repeated text columns (see CATEGORY_COLUMNS) to category dtype."""
+    for col in CATEGORY_COLUMNS:
+        if col in df.columns and df[col].dtype != 'category':
+            df[col] = df[col].astype('category')
+    return df
+
+
+def _load_json(path: Path):
+    """Parse a JSON file from its raw bytes with orjson."""
+    with open(path, 'rb', buffering=1 << 20) as f:
+        raw = f.read()
+    return orjson.loads(raw)
+
+
+def _stringify_mixed_columns(df: pd.DataFrame) -> pd.DataFrame:
+    """Store cells of mixed-type object columns as text so Parquet gets one type per column."""
+    for col in df.columns:
+        if df[col].dtype == 'object' and pd.api.types.infer_dtype(df[col], skipna=True).startswith('mixed'):
+            df[col] = df[col].map(
+                lambda v: None if v is None or v is pd.NA or (isinstance(v, float) and v != v) else str(v)
+            )
+    return df
+
+
+def _read_excel(xlsx_path: Path) -> pd.DataFrame:
+    """Read an Excel file with calamine, mixed-type columns stored as text."""
+    return _stringify_mixed_columns(pd.read_excel(xlsx_path, engine='calamine'))
+
+
+def parquet_cached(version: str, key_paths):
+    """
+    Cache a loader's output as Parquet under CACHE_DIR.
+
+    The cache file is keyed by the loader name, ``version`` and the mtime/size of the
+    source files returned by ``key_paths()``; bump ``version`` when the loader's
+    transformation changes. Empty results are not cached.
+    """
+    def decorator(loader):
+        @functools.wraps(loader)
+        def wrapper():
+            fingerprint = [loader.__name__, version]
+            for path in key_paths():
+                stat = path.stat() if path.exists() else None
+                fingerprint.append(f"{path}:{stat.st_mtime_ns}:{stat.st_size}" if stat else f"{path}:missing")
+            digest = hashlib.sha1('|'.join(fingerprint).encode('utf-8')).hexdigest()[:16]
+            cache_file = CACHE_DIR / f"{loader.__name__}-{digest}.parquet"
+
+            if cache_file.exists():
+                logger.info(f"Reading cached {loader.__name__} output from {cache_file.name}")
+                return pd.read_parquet(cache_file)
+
+            df = loader()
+            if df.empty:
+                return df
+
+            # Return the normalized frame so cold and cached runs see the same data
+            df = _stringify_mixed_columns(df.reset_index(drop=True))
+            CACHE_DIR.mkdir(parents=True, exist_ok=True)
+            for stale in CACHE_DIR.glob(f"{loader.__name__}-*.parquet"):
+                stale.unlink()
+            df.to_parquet(cache_file, index=False, engine='pyarrow', compression='zstd')
+            return df
+        return wrapper
+    return decorator
+
+
+@parquet_cached(version="v1", key_paths=lambda: [FDA_JSON_PATH])
 def load_fda_data() -> pd.DataFrame:
     """Load FDA enforcement data from JSON."""
     logger.info("Loading FDA data...")
 
-    with open(FDA_JSON_PATH, 'r', encoding='utf-8') as f:
-        data = json.load(f)
+    data = _load_json(FDA_JSON_PATH)
 
     if 'results' in data:
         df = pd.DataFrame(data['results'])
@@ -93,11 +179,12 @@ def load_fda_data() -> pd.DataFrame:
     return df
 
 
+@parquet_cached(version="v1", key_paths=lambda: [FSIS_EXCEL_PATH])
 def load_fsis_data() -> pd.DataFrame:
     """Load FSIS recall data from Excel."""
     logger.info("Loading FSIS data...")
 
-    df = pd.read_excel(FSIS_EXCEL_PATH)
+    df = _read_excel(FSIS_EXCEL_PATH)
     logger.info(f"FSIS: Loaded {len(df)} records")
     return df
 
@@ -117,11 +204,30 @@ def load_cdc_data() -> pd.DataFrame:
     # Use most recent file
     cdc_file = sorted(cdc_files)[-1]
 
-    # Load JSON directly then convert to DataFrame
-    with open(cdc_file, 'r', encoding='utf-8') as f:
-        data = json.load(f)
+    # Prefer the typed Parquet sibling written by the fetcher, fall back to JSON
+    parquet_file = cdc_file.with_suffix('.parquet')
+    if parquet_file.exists():
+        df = pd.read_parquet(parquet_file)
+        cdc_file = parquet_file
+    elif ijson is not None:
+        # Stream the records and keep only Food-related outbreaks, so the full file
+        # never sits in memory as Python objects
+        total_before = 0
+        records = []
+        with open(cdc_file, 'rb') as f:
+            for record in ijson.items(f, 'item', use_float=True):
+                total_before += 1
+                if record.get('primary_mode') == 'Food':
+                    records.append(record)
+        df = pd.DataFrame.from_records(records)
+        logger.info(f"CDC: Filtered to Food-related only: {len(df)} of {total_before} records")
+        logger.info(f"CDC: Loaded {len(df)} records from {cdc_file.name}")
+        return df
+    else:
+        # Load JSON directly then convert to DataFrame
+        data = _load_json(cdc_file)
 
-    df = pd.DataFrame(data)
+        df = pd.DataFrame(data)
 
     # Filter to Food-related outbreaks only (exclude Person-to-Person, Water, Animal contact, etc.)
     total_before = len(df)
@@ -148,6 +254,17 @@ def harmonize_country_name(country: str) -> str:
     return country_str.title()
 
 
+def harmonize_country_series(countries: pd.Series) -> pd.Series:
+    """Harmonize a column of country names, resolving each distinct name only once."""
+    lookup = {country: harmonize_country_name(country) for country in countries.dropna().unique()}
+    harmonized = countries.map(lookup).astype(object)
+    return harmonized.where(harmonized.notna(), None)
+
+
+@parquet_cached(
+    version="v2",
+    key_paths=lambda: [RASFF_DIR / "RASFF_pre2021.xlsx", RASFF_DIR / "RASFF_current.xlsx"]
+)
 def load_rasff_data() -> pd.DataFrame:
     """Load RASFF data from Excel files (Historical + Current)."""
     logger.info("Loading RASFF data...")
@@ -160,12 +277,12 @@ def load_rasff_data() -> pd.DataFrame:
     # Load pre-2021 historical data
     if rasff_pre2021_path.exists():
         logger.info("Loading RASFF pre-2021 (historical)...")
-        df_hist = pd.read_excel(rasff_pre2021_path)
+        df_hist = _read_excel(rasff_pre2021_path)
 
-        # Filter for 2012+ only
-        df_hist['Date'] = pd.to_datetime(df_hist['Date'], errors='coerce')
-        df_hist = df_hist[df_hist['Date'] >= '2012-01-01']
-        df_hist = df_hist[df_hist['Date'] < '2021-01-01']  # Avoid overlap
+        # Filter for 2012-2020 only (2021+ comes from the current file, avoid overlap)
+        dates = pd.to_datetime(df_hist['Date'], errors='coerce', format='mixed', cache=True)
+        df_hist = df_hist.loc[dates.between('2012-01-01', '2021-01-01', inclusive='left')].copy()
+        df_hist['Date'] = dates
 
         # Standardize column names
         df_hist = df_hist.rename(columns={
@@ -186,11 +303,14 @@ def load_rasff_data() -> pd.DataFrame:
 
         # Add missing columns
         df_hist['risk_decision'] = None
-        df_hist['hazards'] = df_hist.apply(
-            lambda r: f"{r.get('substance', '')} - {{{r.get('hazard_category', '')}}}"
-            if pd.notna(r.get('substance')) else None,
-            axis=1
-        )
+        # Rebuild the combined hazards text ("substance - {category}") column-wise
+        if 'substance' in df_hist.columns:
+            substance = df_hist['substance']
+            category = df_hist.get('hazard_category', pd.Series('', index=df_hist.index)).fillna('').astype(str)
+            hazards = substance.astype(str) + ' - {' + category + '}'
+            df_hist['hazards'] = hazards.astype(object).where(substance.notna(), None)
+        else:
+            df_hist['hazards'] = None
 
         logger.info(f"RASFF Historical: {len(df_hist)} records (2012-2020)")
         dfs.append(df_hist)
@@ -198,13 +318,12 @@ def load_rasff_data() -> pd.DataFrame:
     # Load current data (2017-2025)
     if rasff_current_path.exists():
         logger.info("Loading RASFF current...")
-        df_curr = pd.read_excel(rasff_current_path)
-
-        # Parse date - handle different formats
-        df_curr['date'] = pd.to_datetime(df_curr['date'], format='%d-%m-%Y %H:%M:%S', errors='coerce')
+        df_curr = _read_excel(rasff_current_path)
 
-        # Filter for 2021+ only (to avoid overlap with historical)
-        df_curr = df_curr[df_curr['date'] >= '2021-01-01']
+        # Parse date and filter for 2021+ only (to avoid overlap with historical)
+        dates = pd.to_datetime(df_curr['date'], format='%d-%m-%Y %H:%M:%S', errors='coerce', cache=True)
+        df_curr = df_curr.loc[dates >= '2021-01-01'].copy()
+        df_curr['date'] = dates
 
         # Add missing columns for consistency
         df_curr['action_taken'] = None
@@ -213,18 +332,14 @@ def load_rasff_data() -> pd.DataFrame:
         df_curr['product'] = None  # 2021+ data has no separate product field
 
         # Parse hazards field: "Listeria monocytogenes - {pathogenic micro-organisms}"
-        def parse_hazards(hazards_text):
-            if pd.isna(hazards_text):
-                return None, None
-            pattern = r'(.+?)\s*-\s*\{(.+?)\}'
-            match = re.match(pattern, str(hazards_text))
-            if match:
-                return match.group(1).strip(), match.group(2).strip()
-            return str(hazards_text), None
-
-        df_curr[['substance', 'hazard_category']] = df_curr['hazards'].apply(
-            lambda x: pd.Series(parse_hazards(x))
-        )
+        hazards = df_curr['hazards'].astype('string')
+        parsed = hazards.str.extract(HAZARD_PATTERN)
+        parsed = parsed.apply(lambda col: col.str.strip())
+        # Unparseable text is kept whole as the substance
+        unmatched = parsed['substance'].isna() & hazards.notna()
+        parsed.loc[unmatched, 'substance'] = hazards[unmatched]
+        parsed = parsed.astype(object)
+        df_curr[['substance', 'hazard_category']] = parsed.where(parsed.notna(), None)
 
         logger.info(f"RASFF Current: {len(df_curr)} records (2021-2025)")
         dfs.append(df_curr)
@@ -242,13 +357,14 @@ def load_rasff_data() -> pd.DataFrame:
     logger.info(f"RASFF filtered to food only: {len(rasff_df)} of {total_before} records (excluded feed & food contact materials)")
 
     # Harmonize country names
-    rasff_df['origin'] = rasff_df['origin'].apply(harmonize_country_name)
-    rasff_df['notifying_country'] = rasff_df['notifying_country'].apply(harmonize_country_name)
+    rasff_df['origin'] = harmonize_country_series(rasff_df['origin'])
+    rasff_df['notifying_country'] = harmonize_country_series(rasff_df['notifying_country'])
 
     logger.info(f"RASFF Total: {len(rasff_df)} records")
     return rasff_df
 
 
+@parquet_cached(version="v1", key_paths=lambda: [UK_FSA_JSON_PATH])
 def load_uk_fsa_data() -> pd.DataFrame:
     """Load UK FSA Food Alerts from JSON (post-Brexit UK data)."""
     logger.info("Loading UK FSA data...")
@@ -257,25 +373,22 @@ def load_uk_fsa_data() -> pd.DataFrame:
         logger.warning(f"UK FSA file not found: {UK_FSA_JSON_PATH}")
         return pd.DataFrame()
 
-    with open(UK_FSA_JSON_PATH, 'r', encoding='utf-8') as f:
-        data = json.load(f)
+    data = _load_json(UK_FSA_JSON_PATH)
 
     items = data.get('items', [])
     if not items:
         logger.warning("No items found in UK FSA JSON")
         return pd.DataFrame()
 
-    # Parse UK FSA records
-    records = []
+    # Parse UK FSA records into columns; dates are parsed in one go afterwards
+    columns = {name: [] for name in (
+        'reference', 'date', 'title', 'product_name', 'alert_type', 'risk_statement',
+        'allergens', 'countries', 'url', 'status'
+    )}
     for item in items:
-        # Parse date
-        created = item.get('created', '')
-        date_val = pd.to_datetime(created, errors='coerce') if created else None
-
-        # Extract alert type from 'type' list
-        types = item.get('type', [])
+        # Extract alert type from 'type' list (last match wins)
         alert_type = 'Alert'
-        for t in types:
+        for t in item.get('type', []):
             if '/AA' in t:
                 alert_type = 'Allergy Alert'
             elif '/PRIN' in t:
@@ -285,25 +398,20 @@ def load_uk_fsa_data() -> pd.DataFrame:
 
         # Extract product info from productDetails
         product_details = item.get('productDetails', [])
-        product_name = ''
-        if product_details:
-            product_name = product_details[0].get('productName', '')
+        product_name = product_details[0].get('productName', '') if product_details else ''
 
         # Extract risk/problem info
-        problems = item.get('problem', [])
         risk_statement = ''
         allergens = []
-        for prob in problems:
+        for prob in item.get('problem', []):
             rs = prob.get('riskStatement', '')
             if rs:
                 risk_statement = rs
-            for allergen in prob.get('allergen', []):
-                allergens.append(allergen.get('label', ''))
+            allergens.extend(allergen.get('label', '') for allergen in prob.get('allergen', []))
 
         # Extract country (usually UK nations)
-        countries = item.get('country', [])
         country_labels = []
-        for c in countries:
+        for c in item.get('country', []):
             label = c.get('label', '')
             # Label can be a list or string
             if isinstance(label, list):
@@ -311,20 +419,21 @@ def load_uk_fsa_data() -> pd.DataFrame:
             if label:
                 country_labels.append(label)
 
-        records.append({
-            'reference': item.get('notation', ''),
-            'date': date_val,
-            'title': item.get('title', ''),
-            'product_name': product_name if product_name else item.get('shortTitle', ''),
-            'alert_type': alert_type,
-            'risk_statement': risk_statement,
-            'allergens': ', '.join(allergens) if allergens else None,
-            'countries': ', '.join(country_labels) if country_labels else 'United Kingdom',
-            'url': item.get('alertURL', ''),
-            'status': item.get('status', {}).get('label', '') if isinstance(item.get('status', {}).get('label', ''), str) else item.get('status', {}).get('label', [''])[0]
-        })
-
-    df = pd.DataFrame(records)
+        status = item.get('status', {}).get('label', '')
+
+        columns['reference'].append(item.get('notation', ''))
+        columns['date'].append(item.get('created') or None)
+        columns['title'].append(item.get('title', ''))
+        columns['product_name'].append(product_name if product_name else item.get('shortTitle', ''))
+        columns['alert_type'].append(alert_type)
+        columns['risk_statement'].append(risk_statement)
+        columns['allergens'].append(', '.join(allergens) if allergens else None)
+        columns['countries'].append(', '.join(country_labels) if country_labels else 'United Kingdom')
+        columns['url'].append(item.get('alertURL', ''))
+        columns['status'].append(status if isinstance(status, str) else status[0])
+
+    df = pd.DataFrame(columns)
+    df['date'] = pd.to_datetime(df['date'], format='ISO8601', errors='coerce')
     logger.info(f"UK FSA: Loaded {len(df)} records")
 
     # Show date range
@@ -349,18 +458,24 @@ def create_dim_date(min_year: int = 2012, max_year: int = 2025) -> pd.DataFrame:
     # FDA Fiscal Year: October-September (FY 2024 = Oct 2023 - Sep 2024)
     fiscal_year = dates.year.where(dates.month < 10, dates.year + 1)
 
+    # Numeric key and names from plain arrays instead of per-date strftime
+    year = dates.year.to_numpy().astype(np.int64)
+    month = dates.month.to_numpy()
+    month_names = np.array(list(calendar.month_name))
+    day_names = np.array(list(calendar.day_name))
+
     dim_date = pd.DataFrame({
-        'DateKey': dates.strftime('%Y%m%d').astype(int),
+        'DateKey': year * 10000 + month * 100 + dates.day.to_numpy(),
         'Date': dates.strftime('%Y-%m-%d'),  # String format for Synapse compatibility
         'Year': dates.year,
         'FiscalYear': fiscal_year.astype(int),  # FDA Fiscal Year (Oct-Sep)
         'Quarter': dates.quarter,
         'FiscalQuarter': ((dates.month - 10) % 12 // 3 + 1),  # FDA FQ: Q1=Oct-Dec, Q2=Jan-Mar, etc.
         'Month': dates.month,
-        'MonthName': dates.strftime('%B'),
+        'MonthName': month_names[month],
         'Day': dates.day,
         'DayOfWeek': dates.dayofweek + 1,  # 1=Monday
-        'DayName': dates.strftime('%A'),
+        'DayName': day_names[dates.dayofweek.to_numpy()],
         'WeekOfYear': dates.isocalendar().week.astype(int)
     })
 
@@ -368,6 +483,37 @@ def create_dim_date(min_year: int = 2012, max_year: int = 2025) -> pd.DataFrame:
     return dim_date
 
 
+def _distinct_values(series: pd.Series) -> pd.Series:
+    """Non-null distinct values in order of first appearance (read from the codes for categoricals)."""
+    if isinstance(series.dtype, pd.CategoricalDtype):
+        codes = pd.unique(series.cat.codes.to_numpy())
+        values = series.cat.categories.take(codes[codes >= 0])
+    else:
+        values = series.dropna().unique()
+    return pd.Series(values, dtype=object)
+
+
+def _make_geo_rows(keys, countries, states=None, country_code=None, region=None) -> pd.DataFrame:
+    """Build dim_geography rows (plus their geo_map lookup key) for a set of countries."""
+    keys = pd.Series(list(keys), dtype=object)
+    countries = pd.Series([countries] * len(keys) if isinstance(countries, str) else list(countries), dtype=object)
+    is_eu = countries.isin(EU_MEMBERS)
+    is_efta = countries.isin(EFTA_COUNTRIES)
+    if region is None:
+        region = np.select(
+            [countries == 'United Kingdom', is_eu, is_efta], ['UK', 'EU', 'EFTA'], default='Other'
+        )
+    return pd.DataFrame({
+        'key': keys,
+        'Country': countries,
+        'CountryCode': country_code,
+        'State': pd.Series(list(states), dtype=object) if states is not None else None,
+        'Region': region,
+        'IsEUMember': is_eu,
+        'IsEFTA': is_efta
+    })
+
+
 def create_dim_geography(fda_df: pd.DataFrame, fsis_df: pd.DataFrame, rasff_df: pd.DataFrame = None, uk_fsa_df: pd.DataFrame = None) -> Tuple[pd.DataFrame, dict]:
     """
     Create geography dimension table and mapping.
@@ -386,138 +532,61 @@ def create_dim_geography(fda_df: pd.DataFrame, fsis_df: pd.DataFrame, rasff_df:
     """
     logger.info("Creating dim_geography...")
 
-    geographies = []
-    geo_key = 1
-    geo_map = {}
+    parts = []
 
     # US States from FDA
     if 'state' in fda_df.columns:
-        us_states = fda_df['state'].dropna().unique()
-        for state in us_states:
-            key = f"USA|{state}"
-            if key not in geo_map:
-                geo_map[key] = geo_key
-                geographies.append({
-                    'GeographyKey': geo_key,
-                    'Country': 'United States',
-                    'CountryCode': 'USA',
-                    'State': state,
-                    'Region': 'USA',
-                    'IsEUMember': False,
-                    'IsEFTA': False
-                })
-                geo_key += 1
+        us_states = _distinct_values(fda_df['state'])
+        parts.append(_make_geo_rows(
+            'USA|' + us_states.astype(str), 'United States', states=us_states, country_code='USA', region='USA'
+        ))
 
     # USA default (for records without state, e.g. FSIS)
-    if "USA|" not in geo_map:
-        geo_map["USA|"] = geo_key
-        geographies.append({
-            'GeographyKey': geo_key,
-            'Country': 'United States',
-            'CountryCode': 'USA',
-            'State': None,
-            'Region': 'USA',
-            'IsEUMember': False,
-            'IsEFTA': False
-        })
-        geo_key += 1
+    parts.append(_make_geo_rows(['USA|'], 'United States', country_code='USA', region='USA'))
 
     # RASFF Countries - separate notifying_country (recall geography) and origin (product origin)
     if rasff_df is not None and not rasff_df.empty:
-        # Collect all unique countries from RASFF (both notifying and origin)
-        countries = set()
-        if 'notifying_country' in rasff_df.columns:
-            countries.update(rasff_df['notifying_country'].dropna().unique())
-        if 'origin' in rasff_df.columns:
-            # Also add origin countries for OriginGeographyKey lookup
-            countries.update(rasff_df['origin'].dropna().unique())
-
-        for country in countries:
-            if not country or country == 'None':
-                continue
-            # Skip entries that look like comma-separated lists (distribution data)
-            if ',' in str(country):
-                continue
-
-            key = str(country)  # Simple country name as key
-            if key not in geo_map:
-                is_eu = country in EU_MEMBERS
-                is_efta = country in EFTA_COUNTRIES
-                # Determine region
-                if country == 'United Kingdom':
-                    region = 'UK'
-                elif is_eu:
-                    region = 'EU'
-                elif is_efta:
-                    region = 'EFTA'
-                else:
-                    region = 'Other'
-
-                geo_map[key] = geo_key
-                geographies.append({
-                    'GeographyKey': geo_key,
-                    'Country': country,
-                    'CountryCode': None,
-                    'State': None,
-                    'Region': region,
-                    'IsEUMember': is_eu,
-                    'IsEFTA': is_efta
-                })
-                geo_key += 1
+        # Collect all unique countries from RASFF (both notifying and origin, the latter
+        # for OriginGeographyKey lookup)
+        columns = [c for c in ('notifying_country', 'origin') if c in rasff_df.columns]
+        countries = pd.Series(
+            pd.unique(pd.concat([_distinct_values(rasff_df[c]) for c in columns])) if columns else [],
+            dtype=object
+        )
+        text = countries.astype(str)
+        # Skip blanks and entries that look like comma-separated lists (distribution data)
+        keep = (countries != '') & (text != 'None') & ~text.str.contains(',', regex=False)
+        parts.append(_make_geo_rows(text[keep], countries[keep]))
 
     # UK FSA (United Kingdom - post Brexit)
     if uk_fsa_df is not None and not uk_fsa_df.empty:
-        key = "United Kingdom"
-        if key not in geo_map:
-            geo_map[key] = geo_key
-            geographies.append({
-                'GeographyKey': geo_key,
-                'Country': 'United Kingdom',
-                'CountryCode': 'GBR',
-                'State': None,
-                'Region': 'UK',
-                'IsEUMember': False,  # Post-Brexit
-                'IsEFTA': False
-            })
-            geo_key += 1
+        parts.append(_make_geo_rows(['United Kingdom'], 'United Kingdom', country_code='GBR'))
 
-    # Add FDA origin countries (country field, mostly USA but some imports)
+    # Add FDA origin countries (country field, mostly USA but some imports; USA already present)
     if 'country' in fda_df.columns:
-        for country in fda_df['country'].dropna().unique():
-            country_clean = harmonize_country_name(country)
-            if country_clean and country_clean not in geo_map and ',' not in str(country_clean):
-                is_eu = country_clean in EU_MEMBERS
-                is_efta = country_clean in EFTA_COUNTRIES
-                if country_clean == 'United States':
-                    continue  # Already have USA entries
-                # Determine region
-                if country_clean == 'United Kingdom':
-                    region = 'UK'
-                elif is_eu:
-                    region = 'EU'
-                elif is_efta:
-                    region = 'EFTA'
-                else:
-                    region = 'Other'
-
-                geo_map[country_clean] = geo_key
-                geographies.append({
-                    'GeographyKey': geo_key,
-                    'Country': country_clean,
-                    'CountryCode': None,
-                    'State': None,
-                    'Region': region,
-                    'IsEUMember': is_eu,
-                    'IsEFTA': is_efta
-                })
-                geo_key += 1
-
-    dim_geography = pd.DataFrame(geographies)
+        countries = pd.Series(harmonize_country_series(fda_df['country']).dropna().unique(), dtype=object)
+        keep = (
+            (countries != '') & ~countries.astype(str).str.contains(',', regex=False)
+            & (countries != 'United States')
+        )
+        parts.append(_make_geo_rows(countries[keep], countries[keep]))
+
+    # First occurrence of each lookup key wins, keys are numbered in order
+    dim_geography = pd.concat(parts, ignore_index=True).drop_duplicates(subset='key', ignore_index=True)
+    dim_geography.insert(0, 'GeographyKey', np.arange(1, len(dim_geography) + 1))
+    geo_map = dict(zip(dim_geography.pop('key'), dim_geography['GeographyKey'].tolist()))
     logger.info(f"dim_geography: {len(dim_geography)} rows created")
 
     return dim_geography, geo_map
 
 
+def _new_class_keys(values: pd.Series, source: str, class_map: dict) -> Tuple[list, list]:
+    """Lookup keys ("{source}|{value}") and values for distinct values not yet in class_map."""
+    keys = source + '|' + values.astype(str)
+    fresh = ~keys.duplicated() & ~keys.isin(class_map.keys())
+    return keys[fresh].tolist(), values[fresh].tolist()
+
+
 def create_dim_classification(fda_df: pd.DataFrame, fsis_df: pd.DataFrame, rasff_df: pd.DataFrame = None, uk_fsa_df: pd.DataFrame = None) -> Tuple[pd.DataFrame, dict]:
     """Create classification dimension table and mapping."""
     logger.info("Creating dim_classification...")
@@ -564,92 +633,98 @@ def create_dim_classification(fda_df: pd.DataFrame, fsis_df: pd.DataFrame, rasff
 
     # FDA Classifications
     if 'classification' in fda_df.columns:
-        for cls in fda_df['classification'].dropna().unique():
-            key = f"FDA|{cls}"
-            if key not in class_map:
-                severity_level, severity_score = severity_map.get(cls, ('Unknown', 0))
-                class_map[key] = class_key
-                classifications.append({
-                    'ClassificationKey': class_key,
-                    'Source': 'FDA',
-                    'OriginalClassification': cls,
-                    'USAClassLevel': cls,
-                    'NotificationType': None,
-                    'RiskDecision': None,
-                    'SeverityLevel': severity_level,
-                    'SeverityScore': severity_score
-                })
-                class_key += 1
+        keys, classes = _new_class_keys(_distinct_values(fda_df['classification']), 'FDA', class_map)
+        class_map.update(zip(keys, itertools.count(class_key)))
+        classifications.extend({
+            'ClassificationKey': key,
+            'Source': 'FDA',
+            'OriginalClassification': cls,
+            'USAClassLevel': cls,
+            'NotificationType': None,
+            'RiskDecision': None,
+            'SeverityLevel': severity_level,
+            'SeverityScore': severity_score
+        } for key, cls, (severity_level, severity_score) in zip(
+            itertools.count(class_key), classes, (severity_map.get(cls, ('Unknown', 0)) for cls in classes)
+        ))
+        class_key += len(classes)
 
     # FSIS Classifications
     if 'class' in fsis_df.columns:
-        for cls in fsis_df['class'].dropna().unique():
-            key = f"FSIS|{cls}"
-            if key not in class_map:
-                # FSIS uses 1, 2, 3 or 'Class I', 'Class II', 'Class III'
-                cls_str = str(cls)
-                if cls_str.isdigit():
-                    cls_formatted = f"Class {['I', 'II', 'III'][int(cls_str)-1]}" if int(cls_str) <= 3 else cls_str
-                else:
-                    cls_formatted = cls_str
-                severity_level, severity_score = severity_map.get(cls_formatted, ('Unknown', 0))
-                class_map[key] = class_key
-                classifications.append({
-                    'ClassificationKey': class_key,
-                    'Source': 'FSIS',
-                    'OriginalClassification': cls,
-                    'USAClassLevel': cls_formatted,
-                    'NotificationType': None,
-                    'RiskDecision': None,
-                    'SeverityLevel': severity_level,
-                    'SeverityScore': severity_score
-                })
-                class_key += 1
+        def format_fsis_class(cls):
+            # FSIS uses 1, 2, 3 or 'Class I', 'Class II', 'Class III'
+            cls_str = str(cls)
+            if cls_str.isdigit():
+                return f"Class {['I', 'II', 'III'][int(cls_str)-1]}" if int(cls_str) <= 3 else cls_str
+            return cls_str
+
+        keys, classes = _new_class_keys(_distinct_values(fsis_df['class']), 'FSIS', class_map)
+        class_map.update(zip(keys, itertools.count(class_key)))
+        formatted = [format_fsis_class(cls) for cls in classes]
+        classifications.extend({
+            'ClassificationKey': key,
+            'Source': 'FSIS',
+            'OriginalClassification': cls,
+            'USAClassLevel': cls_formatted,
+            'NotificationType': None,
+            'RiskDecision': None,
+            'SeverityLevel': severity_level,
+            'SeverityScore': severity_score
+        } for key, cls, cls_formatted, (severity_level, severity_score) in zip(
+            itertools.count(class_key), classes, formatted,
+            (severity_map.get(cls_formatted, ('Unknown', 0)) for cls_formatted in formatted)
+        ))
+        class_key += len(classes)
 
     # RASFF Classifications (based on notification type + risk decision)
+    rasff_classifications = None
     if rasff_df is not None and not rasff_df.empty:
-        # Combine classification and risk_decision for unique keys
-        rasff_combos = set()
-        for _, row in rasff_df[['classification', 'risk_decision']].drop_duplicates().iterrows():
-            notif_type = str(row.get('classification', '')) if pd.notna(row.get('classification')) else 'unknown'
-            risk = str(row.get('risk_decision', '')) if pd.notna(row.get('risk_decision')) else 'unknown'
-            rasff_combos.add((notif_type, risk))
-
-        for notif_type, risk in rasff_combos:
-            key = f"RASFF|{notif_type}|{risk}"
-            if key not in class_map:
-                # Map notification type
-                notif_clean = notif_type.lower().replace(' notification', '').strip()
-
-                # Determine severity based on risk_decision
-                risk_lower = risk.lower() if risk else 'unknown'
-                severity_level, severity_score = rasff_severity_map.get(risk_lower, ('Unknown', 0))
-
-                # If no risk decision or unknown, use notification type for severity (fallback)
-                if severity_level == 'Unknown':
-                    notif_lower = notif_type.lower().strip()
-                    # Try exact match first, then partial matches
-                    if notif_lower in rasff_notification_severity_map:
-                        severity_level, severity_score = rasff_notification_severity_map[notif_lower]
-                    else:
-                        # Partial matching for variations
-                        for key, value in rasff_notification_severity_map.items():
-                            if key in notif_lower or notif_lower in key:
-                                severity_level, severity_score = value
-                                break
-
-                class_map[key] = class_key
-                classifications.append({
-                    'ClassificationKey': class_key,
-                    'Source': 'RASFF',
-                    'OriginalClassification': notif_type,
-                    'USAClassLevel': None,  # Not applicable for EU
-                    'NotificationType': notif_type,
-                    'RiskDecision': risk if risk != 'unknown' else None,
-                    'SeverityLevel': severity_level,
-                    'SeverityScore': severity_score
-                })
-                class_key += 1
+        # Unique classification / risk_decision combinations, missing values as 'unknown'
+        combos = rasff_df[['classification', 'risk_decision']]
+        combos = combos.astype(str).where(combos.notna(), 'unknown').drop_duplicates(ignore_index=True)
+        notif_type = combos['classification']
+        risk = combos['risk_decision']
+
+        # Determine severity based on risk_decision
+        risk_severity = pd.DataFrame.from_dict(
+            rasff_severity_map, orient='index', columns=['SeverityLevel', 'SeverityScore']
+        )
+        severity = risk_severity.reindex(risk.str.lower().where(risk != '', 'unknown')).reset_index(drop=True)
+        severity['SeverityLevel'] = severity['SeverityLevel'].fillna('Unknown')
+        severity['SeverityScore'] = severity['SeverityScore'].fillna(0)
+
+        # If no risk decision or unknown, use notification type for severity (fallback)
+        def notification_severity(notif_lower):
+            # Try exact match first, then partial matches for variations
+            if notif_lower in rasff_notification_severity_map:
+                return rasff_notification_severity_map[notif_lower]
+            for notif_key, value in rasff_notification_severity_map.items():
+                if notif_key in notif_lower or notif_lower in notif_key:
+                    return value
+            return None
+
+        unknown = severity['SeverityLevel'] == 'Unknown'
+        notif_lower = notif_type[unknown].str.lower().str.strip()
+        fallback = notif_lower.map({n: notification_severity(n) for n in notif_lower.unique()}).dropna()
+        if not fallback.empty:
+            severity.loc[fallback.index, 'SeverityLevel'] = fallback.str[0]
+            severity.loc[fallback.index, 'SeverityScore'] = fallback.str[1]
+
+        keys = 'RASFF|' + notif_type + '|' + risk
+        class_keys = np.arange(class_key, class_key + len(combos))
+        class_map.update(zip(keys, class_keys.tolist()))
+        class_key += len(combos)
+
+        rasff_classifications = pd.DataFrame({
+            'ClassificationKey': class_keys,
+            'Source': 'RASFF',
+            'OriginalClassification': notif_type,
+            'USAClassLevel': None,  # Not applicable for EU
+            'NotificationType': notif_type,
+            'RiskDecision': risk.astype(object).where(risk != 'unknown', None),
+            'SeverityLevel': severity['SeverityLevel'],
+            'SeverityScore': severity['SeverityScore'].astype(int)
+        })
 
     # UK FSA Classifications (based on alert type)
     if uk_fsa_df is not None and not uk_fsa_df.empty:
@@ -661,25 +736,28 @@ def create_dim_classification(fda_df: pd.DataFrame, fsis_df: pd.DataFrame, rasff
             'Alert': ('Medium', 5)                   # Generic alert
         }
 
-        for alert_type in uk_fsa_df['alert_type'].dropna().unique():
-            key = f"UK_FSA|{alert_type}"
-            if key not in class_map:
-                severity_level, severity_score = uk_severity_map.get(alert_type, ('Medium', 5))
-
-                class_map[key] = class_key
-                classifications.append({
-                    'ClassificationKey': class_key,
-                    'Source': 'UK_FSA',
-                    'OriginalClassification': alert_type,
-                    'USAClassLevel': None,  # Not applicable for UK
-                    'NotificationType': alert_type,
-                    'RiskDecision': None,
-                    'SeverityLevel': severity_level,
-                    'SeverityScore': severity_score
-                })
-                class_key += 1
+        keys, alert_types = _new_class_keys(_distinct_values(uk_fsa_df['alert_type']), 'UK_FSA', class_map)
+        class_map.update(zip(keys, itertools.count(class_key)))
+        classifications.extend({
+            'ClassificationKey': key,
+            'Source': 'UK_FSA',
+            'OriginalClassification': alert_type,
+            'USAClassLevel': None,  # Not applicable for UK
+            'NotificationType': alert_type,
+            'RiskDecision': None,
+            'SeverityLevel': severity_level,
+            'SeverityScore': severity_score
+        } for key, alert_type, (severity_level, severity_score) in zip(
+            itertools.count(class_key), alert_types,
+            (uk_severity_map.get(alert_type, ('Medium', 5)) for alert_type in alert_types)
+        ))
+        class_key += len(alert_types)
 
     dim_classification = pd.DataFrame(classifications)
+    if rasff_classifications is not None:
+        dim_classification = pd.concat(
+            [dim_classification, rasff_classifications], ignore_index=True
+        ).sort_values('ClassificationKey', ignore_index=True)
 
     # Normalize RASFF NotificationType to new naming convention (post-2020 format)
     notification_type_mapping = {
@@ -688,7 +766,10 @@ def create_dim_classification(fda_df: pd.DataFrame, fsis_df: pd.DataFrame, rasff
         'information for attention': 'information notification for attention',
         'information for follow-up': 'information notification for follow-up',
     }
-    dim_classification['NotificationType'] = dim_classification['NotificationType'].replace(notification_type_mapping)
+    renamed = dim_classification['NotificationType'].isin(notification_type_mapping.keys())
+    dim_classification.loc[renamed, 'NotificationType'] = (
+        dim_classification.loc[renamed, 'NotificationType'].map(notification_type_mapping)
+    )
 
     logger.info(f"dim_classification: {len(dim_classification)} rows created")
 
@@ -699,126 +780,119 @@ def create_dim_product(fda_df: pd.DataFrame, fsis_df: pd.DataFrame, rasff_df: pd
     """Create product dimension table and mapping."""
     logger.info("Creating dim_product...")
 
-    products = []
-    product_key = 1
-    product_map = {}
+    # Columns are collected as separate lists and turned into a DataFrame once;
+    # ProductKeys are numbered 1..n in collection order at the end
+    lookup_keys = []
+    product_names = []
+    product_categories = []
 
     # FDA Products - use product_description
     if 'product_description' in fda_df.columns:
-        # Group by truncated product description to reduce cardinality
-        for desc in fda_df['product_description'].dropna().unique():
-            # Use first 200 chars as key
-            key = f"FDA|{desc[:200]}"
-            if key not in product_map:
-                product_map[key] = product_key
-                # Try to categorize based on keywords
-                desc_lower = desc.lower()
-                category = categorize_product(desc_lower)
-                products.append({
-                    'ProductKey': product_key,
-                    'ProductName': desc[:500],
-                    'ProductCategory': category,
-                    'ProductType': get_product_type(category)
-                })
-                product_key += 1
+        descs = fda_df['product_description'].dropna().drop_duplicates()
+        # Group by truncated product description (first 200 chars) to reduce cardinality
+        keys = 'FDA|' + descs.str.slice(0, 200)
+        first = ~keys.duplicated()
+        descs, keys = descs[first], keys[first]
+
+        lookup_keys.extend(keys.tolist())
+        product_names.extend(descs.str.slice(0, 500).tolist())
+        # Try to categorize based on keywords
+        product_categories.extend(categorize_products(descs.str.lower()).tolist())
 
     # FSIS Products - use species and product
     if 'product' in fsis_df.columns:
-        for _, row in fsis_df[['product', 'species']].drop_duplicates().iterrows():
-            product = str(row.get('product', ''))[:200]
-            species = str(row.get('species', '')) if pd.notna(row.get('species')) else ''
-            key = f"FSIS|{product}"
-            if key not in product_map:
-                product_map[key] = product_key
-                fsis_category = species if species else 'Meat/Poultry'
-                products.append({
-                    'ProductKey': product_key,
-                    'ProductName': product[:500],
-                    'ProductCategory': fsis_category,
-                    'ProductType': get_product_type(fsis_category)
-                })
-                product_key += 1
+        rows = fsis_df[['product', 'species']].drop_duplicates()
+        product = rows['product'].astype(object).map(str).str.slice(0, 200)
+        keys = 'FSIS|' + product
+        first = ~keys.duplicated()
+        rows, product, keys = rows[first], product[first], keys[first]
+
+        species = rows['species'].astype(object).map(str, na_action='ignore').fillna('')
+        lookup_keys.extend(keys.tolist())
+        product_names.extend(product.tolist())
+        product_categories.extend(species.where(species != '', 'Meat/Poultry').tolist())
 
     # RASFF Products - use 'product' field for pre-2021, 'category' for 2021+
     if rasff_df is not None and not rasff_df.empty:
         # Include 'product' column (filled for pre-2021, None for 2021+)
-        cols = ['subject', 'category', 'product']
-        rasff_products = rasff_df[cols].drop_duplicates()
-        for _, row in rasff_products.iterrows():
-            subject = str(row.get('subject', ''))[:200] if pd.notna(row.get('subject')) else ''
-            if not subject:
-                continue
-            key = f"RASFF|{subject}"
-            if key not in product_map:
-                category = str(row.get('category', '')) if pd.notna(row.get('category')) else None
-                product_name_raw = row.get('product')
-
-                # Use 'product' if available (pre-2021), otherwise use 'category' (2021+)
-                if pd.notna(product_name_raw) and str(product_name_raw).strip():
-                    product_name = str(product_name_raw)[:500]
-                else:
-                    # For 2021+ data, use category as product identifier
-                    product_name = category if category else 'Unknown Product'
-
-                product_map[key] = product_key
-                products.append({
-                    'ProductKey': product_key,
-                    'ProductName': product_name,
-                    'ProductCategory': category,
-                    'ProductType': get_product_type(category)
-                })
-                product_key += 1
+        rows = rasff_df[['subject', 'category', 'product']]
+        subject = rows['subject'].astype(str).str.slice(0, 200).where(rows['subject'].notna(), '')
+        # First occurrence of each (truncated) subject wins
+        first = ~subject.duplicated() & (subject != '')
+        rows, keys = rows[first], 'RASFF|' + subject[first]
+
+        category = rows['category'].astype(str).astype(object).where(rows['category'].notna(), None)
+        product = rows['product'].astype(str)
+        # Use 'product' if available (pre-2021), otherwise use 'category' (2021+)
+        has_product = rows['product'].notna() & (product.str.strip() != '')
+        fallback = category.where(category.notna() & (category != ''), 'Unknown Product')
+        product_name = product.str.slice(0, 500).astype(object).where(has_product, fallback)
+
+        lookup_keys.extend(keys.tolist())
+        product_names.extend(product_name.tolist())
+        product_categories.extend(category.tolist())
 
     # UK FSA Products - use product_name
     if uk_fsa_df is not None and not uk_fsa_df.empty:
-        for _, row in uk_fsa_df[['product_name']].drop_duplicates().iterrows():
-            product_name = str(row.get('product_name', ''))[:200] if pd.notna(row.get('product_name')) else ''
-            if not product_name:
-                continue
-            key = f"UK_FSA|{product_name}"
-            if key not in product_map:
-                # Try to categorize based on product name
-                category = categorize_product(product_name.lower())
-
-                product_map[key] = product_key
-                products.append({
-                    'ProductKey': product_key,
-                    'ProductName': product_name[:500],
-                    'ProductCategory': category,
-                    'ProductType': get_product_type(category)
-                })
-                product_key += 1
-
-    dim_product = pd.DataFrame(products)
+        names = uk_fsa_df['product_name'].dropna().astype(str).str.slice(0, 200).drop_duplicates()
+        names = names[names != '']
+
+        lookup_keys.extend(('UK_FSA|' + names).tolist())
+        product_names.extend(names.tolist())
+        # Try to categorize based on product name (all names in one pass)
+        product_categories.extend(categorize_products(names.str.lower()).tolist())
+
+    # Keys are unique: each source dedups its own keys and the source prefixes differ
+    product_map = dict(zip(lookup_keys, range(1, len(lookup_keys) + 1)))
+    dim_product = pd.DataFrame({
+        'ProductKey': np.arange(1, len(lookup_keys) + 1),
+        'ProductName': product_names,
+        'ProductCategory': product_categories
+    })
+    dim_product['ProductType'] = get_product_types(dim_product['ProductCategory'])
+
+    # Few distinct categories/types across many products: store as categoricals
+    dim_product['ProductCategory'] = dim_product['ProductCategory'].astype('category')
+    dim_product['ProductType'] = dim_product['ProductType'].astype('category')
+    # RASFF 2021+ names repeat their category, so names can be repetitive too
+    if dim_product['ProductName'].nunique() < 0.5 * len(dim_product):
+        dim_product['ProductName'] = dim_product['ProductName'].astype('category')
     logger.info(f"dim_product: {len(dim_product)} rows created")
 
     return dim_product, product_map
 
 
-def categorize_product(desc: str) -> str:
-    """Categorize product based on description keywords."""
-    if any(kw in desc for kw in ['beef', 'steak', 'burger', 'meat', 'pork', 'chicken', 'poultry', 'turkey']):
-        return 'Meat/Poultry'
-    elif any(kw in desc for kw in ['fish', 'salmon', 'tuna', 'seafood', 'shrimp', 'crab']):
-        return 'Fish/Seafood'
-    elif any(kw in desc for kw in ['milk', 'cheese', 'dairy', 'yogurt', 'butter', 'cream']):
-        return 'Dairy'
-    elif any(kw in desc for kw in ['vegetable', 'lettuce', 'spinach', 'tomato', 'salad']):
-        return 'Vegetables'
-    elif any(kw in desc for kw in ['fruit', 'apple', 'orange', 'berry', 'grape']):
-        return 'Fruits'
-    elif any(kw in desc for kw in ['nut', 'peanut', 'almond', 'cashew']):
-        return 'Nuts/Seeds'
-    elif any(kw in desc for kw in ['bread', 'bakery', 'cookie', 'cake', 'pastry']):
-        return 'Bakery'
-    elif any(kw in desc for kw in ['candy', 'chocolate', 'sweet']):
-        return 'Confectionery'
-    elif any(kw in desc for kw in ['spice', 'seasoning', 'herb']):
-        return 'Spices/Seasonings'
-    elif any(kw in desc for kw in ['supplement', 'vitamin', 'dietary']):
-        return 'Dietary Supplements'
-    else:
-        return 'Other'
+# Product category keywords, checked in order (first category with a substring match wins)
+PRODUCT_CATEGORY_KEYWORDS = [
+    ('Meat/Poultry', ['beef', 'steak', 'burger', 'meat', 'pork', 'chicken', 'poultry', 'turkey']),
+    ('Fish/Seafood', ['fish', 'salmon', 'tuna', 'seafood', 'shrimp', 'crab']),
+    ('Dairy', ['milk', 'cheese', 'dairy', 'yogurt', 'butter', 'cream']),
+    ('Vegetables', ['vegetable', 'lettuce', 'spinach', 'tomato', 'salad']),
+    ('Fruits', ['fruit', 'apple', 'orange', 'berry', 'grape']),
+    ('Nuts/Seeds', ['nut', 'peanut', 'almond', 'cashew']),
+    ('Bakery', ['bread', 'bakery', 'cookie', 'cake', 'pastry']),
+    ('Confectionery', ['candy', 'chocolate', 'sweet']),
+    ('Spices/Seasonings', ['spice', 'seasoning', 'herb']),
+    ('Dietary Supplements', ['supplement', 'vitamin', 'dietary']),
+]
+PRODUCT_CATEGORY_PATTERNS = [
+    (category, '|'.join(map(re.escape, keywords)))
+    for category, keywords in PRODUCT_CATEGORY_KEYWORDS
+]
+
+
+def categorize_products(descs: pd.Series) -> pd.Series:
+    """Categorize lower-cased product descriptions by keywords (first matching category wins)."""
+    texts = descs.astype('string[pyarrow]')
+    conditions = [
+        texts.str.contains(pattern).to_numpy(dtype=bool, na_value=False)
+        for _, pattern in PRODUCT_CATEGORY_PATTERNS
+    ]
+    # Select category positions, then take from one object array so every row
+    # shares the same str object per category instead of a fresh copy
+    codes = np.select(conditions, np.arange(len(PRODUCT_CATEGORY_PATTERNS)), default=len(PRODUCT_CATEGORY_PATTERNS))
+    labels = np.array([category for category, _ in PRODUCT_CATEGORY_PATTERNS] + ['Other'], dtype=object)
+    return pd.Series(labels[codes], index=descs.index, dtype=object)
 
 
 # ============================================================================
@@ -891,37 +965,43 @@ PRODUCT_TYPE_MAPPING = {
 }
 
 
-def get_product_type(category: str) -> str:
-    """Map ProductCategory to ProductType."""
-    if not category or pd.isna(category):
-        return 'Unknown'
-
-    category_lower = str(category).lower().strip()
-
-    # Direct match
-    if category_lower in PRODUCT_TYPE_MAPPING:
-        return PRODUCT_TYPE_MAPPING[category_lower]
-
-    # Case-insensitive lookup
-    for key, value in PRODUCT_TYPE_MAPPING.items():
-        if key.lower() == category_lower:
-            return value
+# Lower-cased keys for the case-insensitive lookup in get_product_types
+PRODUCT_TYPE_MAPPING_LOWER = {key.lower(): value for key, value in PRODUCT_TYPE_MAPPING.items()}
 
-    # Partial match for common patterns
-    if 'meat' in category_lower or 'poultry' in category_lower:
-        return 'Fresh Protein'
-    if 'fish' in category_lower or 'seafood' in category_lower:
-        return 'Seafood'
-    if 'dairy' in category_lower or 'milk' in category_lower:
-        return 'Dairy'
-    if 'vegetable' in category_lower or 'fruit' in category_lower:
-        return 'Fresh Produce'
-    if 'supplement' in category_lower or 'vitamin' in category_lower:
-        return 'Supplement'
-    if 'feed' in category_lower or 'pet food' in category_lower:
-        return 'Animal Feed'
+# Partial matches for common patterns, checked in order when there is no exact match
+PRODUCT_TYPE_FALLBACK_PATTERNS = [
+    (product_type, '|'.join(map(re.escape, keywords)))
+    for product_type, keywords in [
+        ('Fresh Protein', ['meat', 'poultry']),
+        ('Seafood', ['fish', 'seafood']),
+        ('Dairy', ['dairy', 'milk']),
+        ('Fresh Produce', ['vegetable', 'fruit']),
+        ('Supplement', ['supplement', 'vitamin']),
+        ('Animal Feed', ['feed', 'pet food']),
+    ]
+]
+
+
+def get_product_types(categories: pd.Series) -> pd.Series:
+    """Map ProductCategory to ProductType; each distinct category is resolved once."""
+    codes, uniques = pd.factorize(categories)
+    uniques = pd.Series(uniques, dtype=object)
+    category_lower = uniques.astype(str).str.lower().str.strip()
+
+    types = category_lower.map(PRODUCT_TYPE_MAPPING_LOWER)
+    unmatched = types.isna()
+    if unmatched.any():
+        remaining = category_lower[unmatched]
+        types[unmatched] = np.select(
+            [remaining.str.contains(pattern) for _, pattern in PRODUCT_TYPE_FALLBACK_PATTERNS],
+            [product_type for product_type, _ in PRODUCT_TYPE_FALLBACK_PATTERNS],
+            default='Other'
+        )
+    types[uniques == ''] = 'Unknown'
 
-    return 'Other'
+    # Missing categories factorize to -1
+    resolved = np.append(types.to_numpy(dtype=object), 'Unknown')
+    return pd.Series(resolved[codes], index=categories.index)
 
 
 # ============================================================================
@@ -1316,147 +1396,313 @@ RASFF_PRODUCT_CONTAMINANTS = {
 }
 
 
-def classify_recall_reason(reason_text: str) -> Tuple[str, str, str]:
+@functools.lru_cache(maxsize=None)
+def _keyword_alternation(keywords: tuple) -> str:
+    """Literal alternation regex matching any of the keywords, built once per keyword table."""
+    return '|'.join(map(re.escape, keywords))
+
+
+def _contains_any(texts: pd.Series, keywords) -> np.ndarray:
+    """Boolean mask of texts containing at least one of the keywords."""
+    return texts.str.contains(_keyword_alternation(tuple(keywords))).to_numpy(dtype=bool)
+
+
+def _first_keyword_hits(texts: pd.Series, keyword_map: dict, pending: Optional[np.ndarray] = None) -> np.ndarray:
+    """
+    Value of the first keyword (in dict order) contained in each text, None where nothing matches.
+
+    Only texts flagged in ``pending`` are looked at, so rows already settled by an earlier rule are skipped.
     """
-    Classify recall reason into 3-level hierarchy based on DeBeer et al. 2024.
+    hits = np.full(len(texts), None, dtype=object)
+    # One alternation scan finds the texts with any hit; only those are resolved keyword by keyword
+    candidates = _contains_any(texts, keyword_map)
+    if pending is not None:
+        candidates = candidates & pending
+    candidates = np.flatnonzero(candidates)
+    if len(candidates) == 0:
+        return hits
+    subset = texts.iloc[candidates]
+    resolved = np.full(len(candidates), None, dtype=object)
+    # Walk the table backwards so earlier keywords overwrite later ones
+    for keyword, value in reversed(keyword_map.items()):
+        resolved[subset.str.contains(keyword, regex=False).to_numpy(dtype=bool)] = value
+    hits[candidates] = resolved
+    return hits
+
+
+def classify_recall_reasons(reasons: pd.Series) -> pd.DataFrame:
+    """
+    Classify recall reasons into the 3-level hierarchy based on DeBeer et al. 2024.
+
+    Each distinct lowercased reason is screened once per keyword table with a single alternation
+    scan; only texts that hit (and are not settled by an earlier rule) are resolved keyword by
+    keyword, first keyword in table order wins. The first matching rule is then picked with np.select;
+    missing or empty reasons are ('Other', 'Other', None), unmatched ones ('Other', 'Other', 'Other').
 
     Returns:
-        Tuple of (RecallCategory, RecallGroup, RecallSubgroup)
+        DataFrame with RecallCategory, RecallGroup and RecallSubgroup aligned to ``reasons``
         - RecallCategory: 'Product Contaminant' or 'Process Issue'
         - RecallGroup: 'Biological Contamination', 'Allergens', 'Chemical Contamination', etc.
-        - RecallSubgroup: Specific pathogen/allergen/chemical or None
+        - RecallSubgroup: Specific pathogen/allergen/chemical
     """
-    if not reason_text or pd.isna(reason_text):
-        return ('Other', 'Other', None)
-
-    text_lower = str(reason_text).lower()
-
-    # Check for biological contamination (pathogens)
-    for keyword, pathogen in PATHOGENS.items():
-        if keyword in text_lower:
-            return ('Product Contaminant', 'Biological Contamination', pathogen)
-
-    # Check for allergens - "undeclared" is key indicator
-    # But also check for allergen keywords without undeclared (still allergen issue)
-    is_undeclared = ('undeclared' in text_lower or 'not declared' in text_lower or
-                     'may contain' in text_lower or 'same equipment' in text_lower or
-                     'shared equipment' in text_lower or 'presence of' in text_lower or
-                     'tested positive' in text_lower or 'detected' in text_lower)  # e.g. "peanuts detected"
-    is_labeling_issue = ('does not declare' in text_lower or 'do not declare' in text_lower or
-                         'not list' in text_lower or 'without an ingredient' in text_lower or
-                         'absence of' in text_lower or 'did not list' in text_lower or
-                         'not on the label' in text_lower or 'missing' in text_lower)
-    for keyword, allergen in ALLERGENS.items():
-        if keyword in text_lower:
-            # Allergens are Product Contaminants when undeclared or labeling issue
-            if is_undeclared or is_labeling_issue or 'label' in text_lower:
-                return ('Product Contaminant', 'Allergens', allergen)
-            elif 'allerg' in text_lower:
-                return ('Product Contaminant', 'Allergens', allergen)
-
-    # Check for chemical contamination (includes RASFF-specific categories)
-    for keyword, chemical in CHEMICALS.items():
-        if keyword in text_lower:
-            return ('Product Contaminant', 'Chemical Contamination', chemical)
-
-    # Check for RASFF-specific product contaminants
-    for keyword, contaminant in RASFF_PRODUCT_CONTAMINANTS.items():
-        if keyword in text_lower:
-            return ('Product Contaminant', 'Chemical Contamination', contaminant)
-
-    # Check for foreign objects
-    for keyword, obj in FOREIGN_OBJECTS.items():
-        if keyword in text_lower:
-            return ('Product Contaminant', 'Foreign Objects', obj)
-
-    # Check for RASFF allergen patterns like "(allergens)" or "nuts (allergens)"
-    if '(allergens)' in text_lower:
-        # Try to extract specific allergen before the (allergens) tag
-        if 'nuts' in text_lower:
-            return ('Product Contaminant', 'Allergens', 'Tree Nuts')
-        elif 'lactoprotein' in text_lower or 'milk' in text_lower:
-            return ('Product Contaminant', 'Allergens', 'Milk')
+    reasons = pd.Series(reasons, dtype=object).reset_index(drop=True)
+    missing = (reasons.isna() | (reasons == '')).to_numpy(dtype=bool)
+    codes, uniques = pd.factorize(reasons.where(~missing, '').astype(str).str.lower())
+    # Arrow-backed so the keyword scans run as RE2 kernels (object dtype on pandas 2.x otherwise)
+    texts = pd.Series(uniques, dtype='string[pyarrow]')
+
+    def has(keyword):
+        return texts.str.contains(keyword, regex=False).to_numpy(dtype=bool)
+
+    is_undeclared = _contains_any(texts, [
+        'undeclared', 'not declared', 'may contain', 'same equipment',
+        'shared equipment', 'presence of', 'tested positive', 'detected'])
+    is_labeling_issue = _contains_any(texts, [
+        'does not declare', 'do not declare', 'not list', 'without an ingredient',
+        'absence of', 'did not list', 'not on the label', 'missing'])
+    allergens_tag = has('(allergens)')
+    is_color = _contains_any(texts, ['color', 'colour', 'dye'])
+    is_food_color = (has('undeclared') & is_color) | has('fd&c') | has('artificial color')
+
+    # Allergens are Product Contaminants when undeclared, a labeling issue or flagged as allergy
+    pathogen = _first_keyword_hits(texts, PATHOGENS)
+    settled = pd.notna(pathogen)
+    allergen = _first_keyword_hits(
+        texts, ALLERGENS, ~settled & (is_undeclared | is_labeling_issue | has('label') | has('allerg')))
+    settled |= pd.notna(allergen)
+    chemical = _first_keyword_hits(texts, CHEMICALS, ~settled)
+    settled |= pd.notna(chemical)
+    contaminant = _first_keyword_hits(texts, RASFF_PRODUCT_CONTAMINANTS, ~settled)
+    settled |= pd.notna(contaminant)
+    foreign_object = _first_keyword_hits(texts, FOREIGN_OBJECTS, ~settled)
+    settled |= pd.notna(foreign_object) | allergens_tag | is_food_color
+    issue_type = _first_keyword_hits(texts, PROCESS_ISSUE_KEYWORDS, ~settled)
+
+    # Rules in priority order: (condition, category, group, subgroup)
+    rules = [
+        (pd.notna(pathogen), 'Product Contaminant', 'Biological Contamination', pathogen),
+        (pd.notna(allergen), 'Product Contaminant', 'Allergens', allergen),
+        (pd.notna(chemical), 'Product Contaminant', 'Chemical Contamination', chemical),
+        (pd.notna(contaminant), 'Product Contaminant', 'Chemical Contamination', contaminant),
+        (pd.notna(foreign_object), 'Product Contaminant', 'Foreign Objects', foreign_object),
+        (allergens_tag & has('nuts'), 'Product Contaminant', 'Allergens', 'Tree Nuts'),
+        (allergens_tag & (has('lactoprotein') | has('milk')), 'Product Contaminant', 'Allergens', 'Milk'),
+        (allergens_tag, 'Product Contaminant', 'Allergens', 'Allergens - Other'),
+        (is_food_color, 'Product Contaminant', 'Undeclared Food Colors', 'Undeclared Food Colors - Other'),
+        (pd.notna(issue_type), 'Process Issue', issue_type,
+         np.array([None if t is None else f'{t} - Other' for t in issue_type], dtype=object)),
+        (is_undeclared | is_labeling_issue, 'Product Contaminant', 'Allergens', 'Allergens - Other'),
+        (_contains_any(texts, ['pathogen', 'bacteria', 'microbial', 'microorganism', 'contamination', 'contaminated']),
+         'Product Contaminant', 'Biological Contamination', 'Biological Contamination - Other'),
+    ]
+    rule = np.select([condition for condition, *_ in rules], np.arange(len(rules)), default=len(rules))
+
+    columns = {}
+    for position, name in enumerate(['RecallCategory', 'RecallGroup', 'RecallSubgroup'], start=1):
+        values = np.full(len(texts), 'Other', dtype=object)
+        for index, entry in enumerate(rules):
+            matched = rule == index
+            value = entry[position]
+            values[matched] = value[matched] if isinstance(value, np.ndarray) else value
+        values = values[codes]
+        if name == 'RecallSubgroup':
+            values[missing] = None
         else:
-            return ('Product Contaminant', 'Allergens', 'Allergens - Other')
-
-    # Check for undeclared food colors
-    if 'undeclared' in text_lower and ('color' in text_lower or 'colour' in text_lower or 'dye' in text_lower):
-        return ('Product Contaminant', 'Undeclared Food Colors', 'Undeclared Food Colors - Other')
-    if 'fd&c' in text_lower or 'artificial color' in text_lower:
-        return ('Product Contaminant', 'Undeclared Food Colors', 'Undeclared Food Colors - Other')
-
-    # Check for process issues (includes RASFF-specific categories)
-    for keyword, issue_type in PROCESS_ISSUE_KEYWORDS.items():
-        if keyword in text_lower:
-            return ('Process Issue', issue_type, f'{issue_type} - Other')
-
-    # If "undeclared" or labeling issue without specific allergen found, likely allergen issue
-    if is_undeclared or is_labeling_issue:
-        return ('Product Contaminant', 'Allergens', 'Allergens - Other')
-
-    # Generic pathogen keywords
-    if any(kw in text_lower for kw in ['pathogen', 'bacteria', 'microbial', 'microorganism', 'contamination', 'contaminated']):
-        return ('Product Contaminant', 'Biological Contamination', 'Biological Contamination - Other')
-
-    # Default: Other (we know something about it, just not classified)
-    return ('Other', 'Other', 'Other')
+            values[missing] = 'Other'
+        columns[name] = values
+    return pd.DataFrame(columns, dtype=object)
 
 
 def create_dim_company(fda_df: pd.DataFrame) -> Tuple[pd.DataFrame, dict]:
     """Create company dimension table and mapping."""
     logger.info("Creating dim_company...")
 
-    companies = []
-    company_key = 1
+    dim_company = pd.DataFrame()
     company_map = {}
 
     # FDA Companies
     if 'recalling_firm' in fda_df.columns:
-        for _, row in fda_df[['recalling_firm', 'city', 'state', 'country']].drop_duplicates().iterrows():
-            firm = str(row.get('recalling_firm', ''))[:200]
-            if not firm or firm == 'nan':
-                continue
-            key = f"{firm}"
-            if key not in company_map:
-                company_map[key] = company_key
-                companies.append({
-                    'CompanyKey': company_key,
-                    'CompanyName': firm,
-                    'City': str(row.get('city', '')) if pd.notna(row.get('city')) else None,
-                    'State': str(row.get('state', '')) if pd.notna(row.get('state')) else None,
-                    'Country': str(row.get('country', 'United States')) if pd.notna(row.get('country')) else 'United States',
-                    'EstablishmentNumber': None
-                })
-                company_key += 1
-
-    dim_company = pd.DataFrame(companies)
+        rows = fda_df[['recalling_firm', 'city', 'state', 'country']].drop_duplicates()
+        firm = _text_column(rows, 'recalling_firm').str.slice(0, 200)
+        # Skip blank/missing firms; the first location seen for a firm wins
+        keep = (firm != '') & (firm != 'nan') & ~firm.duplicated()
+        rows, firm = rows[keep], firm[keep]
+
+        if len(rows):
+            company_keys = np.arange(1, len(rows) + 1)
+            company_map = dict(zip(firm.tolist(), company_keys.tolist()))
+            dim_company = pd.DataFrame({
+                'CompanyKey': company_keys,
+                'CompanyName': firm.tolist(),
+                'City': _optional_text_column(rows, 'city').tolist(),
+                'State': _optional_text_column(rows, 'state').tolist(),
+                'Country': _optional_text_column(rows, 'country', missing='United States').tolist(),
+                'EstablishmentNumber': [None] * len(rows)
+            })
+
     logger.info(f"dim_company: {len(dim_company)} rows created")
 
     return dim_company, company_map
 
 
-def parse_date(date_val) -> Optional[datetime]:
-    """Parse various date formats."""
-    if pd.isna(date_val):
-        return None
+# Date formats tried in order by parse_dates
+DATE_FORMATS = [
+    '%Y%m%d',       # 20240115
+    '%Y-%m-%d',     # 2024-01-15
+    '%m/%d/%Y',     # 01/15/2024
+    '%d/%m/%Y',     # 15/01/2024
+]
 
-    date_str = str(date_val)
 
-    # Try common formats
-    formats = [
-        '%Y%m%d',       # 20240115
-        '%Y-%m-%d',     # 2024-01-15
-        '%m/%d/%Y',     # 01/15/2024
-        '%d/%m/%Y',     # 15/01/2024
-    ]
+def parse_dates(values: pd.Series) -> pd.Series:
+    """
+    Parse a column of dates given in any of DATE_FORMATS (first 10 characters of each value).
+
+    Each distinct value is tried against DATE_FORMATS in order, every format only on the values
+    still unparsed. Returns datetimes aligned to ``values`` with NaT where nothing matched.
+    """
+    parsed = pd.Series(pd.NaT, index=values.index, dtype='datetime64[us]')
+    present = values.notna().to_numpy()
+    if not present.any():
+        return parsed
+
+    codes, uniques = pd.factorize(values[present].astype(str).str.slice(0, 10))
+    unique_dates = pd.Series(pd.NaT, index=range(len(uniques)), dtype='datetime64[us]')
+    for fmt in DATE_FORMATS:
+        pending = unique_dates.isna()
+        if not pending.any():
+            break
+        unique_dates[pending] = pd.to_datetime(uniques[pending.to_numpy()], format=fmt, errors='coerce')
 
-    for fmt in formats:
+    parsed[present] = unique_dates.to_numpy()[codes]
+    return parsed
+
+
+def key_series(key_map: dict) -> pd.Series:
+    """Dimension map as an int64 Series indexed by lookup key, so repeated joins reuse one hash table."""
+    return pd.Series(np.fromiter(key_map.values(), dtype=np.int64, count=len(key_map)), index=list(key_map.keys()))
+
+
+def lookup_keys(key_map, keys: pd.Series, default: Optional[int]) -> np.ndarray:
+    """
+    Resolve a whole column of lookup keys against a dimension map in one hash join.
+
+    ``key_map`` is a dict or a prebuilt key_series(). Unknown keys get ``default``; with
+    ``default=None`` an object array holding None is returned.
+    """
+    if isinstance(key_map, dict):
+        key_map = key_series(key_map)
+    if key_map.empty:
+        return np.full(len(keys), default, dtype=np.int64 if default is not None else object)
+    positions = key_map.index.get_indexer(keys)
+    values = key_map.to_numpy()
+    if default is None:
+        resolved = values[positions].astype(object)
+        resolved[positions < 0] = None
+        return resolved
+    return np.where(positions >= 0, values[positions], default)
+
+
+def _text_column(df: pd.DataFrame, column: str, default: str = '') -> pd.Series:
+    """str() of every cell (so missing cells read 'nan'/'None'), `default` when the column is absent."""
+    if column not in df.columns:
+        return pd.Series(default, index=df.index, dtype=object)
+    return df[column].astype(object).map(str)
+
+
+def _optional_text_column(df: pd.DataFrame, column: str, missing=None, length: int = None) -> pd.Series:
+    """str() of every non-missing cell (cut to `length`), `missing` elsewhere or when the column is absent."""
+    if column not in df.columns:
+        return pd.Series([missing] * len(df), index=df.index, dtype=object)
+    values = df[column].astype(object)
+    present = values.notna()
+    text = values.map(str, na_action='ignore')
+    # An all-missing column maps to floats, which have no .str accessor (and nothing to cut)
+    if length is not None and present.any():
+        text = text.str.slice(0, length)
+    return text.astype(object).where(present, missing)
+
+
+def _date_keys(dates) -> list:
+    """YYYYMMDD integer DateKeys for a column or list of datetimes (None for missing dates)."""
+    if not isinstance(dates, pd.Series) or not pd.api.types.is_datetime64_any_dtype(dates):
         try:
-            return datetime.strptime(date_str[:10], fmt)
+            dates = pd.to_datetime(pd.Series(list(dates), dtype=object))
         except ValueError:
-            continue
+            # Naive and tz-aware values mixed (strings parsed by _loaded_dates): key each date's own fields
+            return [d.year * 10000 + d.month * 100 + d.day if d is not None and d is not pd.NaT else None
+                    for d in dates]
+    present = dates.notna().to_numpy()
+    keys = np.full(len(dates), None, dtype=object)
+    parts = dates[present].dt
+    keys[present] = (parts.year * 10000 + parts.month * 100 + parts.day).tolist()
+    return keys.tolist()
+
+
+def _date_values(dates: pd.Series) -> list:
+    """RecallDate values from parsed datetimes: Timestamps, None where the date is missing."""
+    return dates.astype(object).where(dates.notna(), None).tolist()
+
+
+def _loaded_dates(df: pd.DataFrame) -> list:
+    """RecallDate values from a 'date' column the loader already converted to datetime (RASFF, UK FSA)."""
+    if 'date' not in df.columns:
+        return [None] * len(df)
+    dates = df['date']
+    if not pd.api.types.is_datetime64_any_dtype(dates):
+        # Leftover strings are parsed once per distinct value (each with its own format inference);
+        # strings that fail to parse become NaT, missing dates None (code -1 picks the trailing None)
+        codes, uniques = pd.factorize(dates.astype(object))
+        resolved = [pd.to_datetime(v, errors='coerce') if isinstance(v, str) else v for v in uniques]
+        return np.array(resolved + [None], dtype=object)[codes].tolist()
+    return _date_values(dates)
+
+
+def _fact_block(source: str, df: pd.DataFrame, first_key: int, id_column: str, **columns) -> dict:
+    """
+    Assemble one source's fact_recalls columns as plain lists.
 
-    return None
+    RecallID comes from ``id_column`` ("{source}-{RecallKey}" when the column is absent) and is reused
+    as EventID unless one is given. Scalars in ``columns`` are repeated for every row.
+    """
+    n = len(df)
+    recall_keys = list(range(first_key, first_key + n))
+    if id_column in df.columns:
+        recall_ids = _text_column(df, id_column).tolist()
+    else:
+        recall_ids = [f'{source}-{key}' for key in recall_keys]
+
+    # Classify recall reason
+    classified = classify_recall_reasons(columns['ReasonForRecall'])
+    recall_category = classified['RecallCategory'].tolist()
+    recall_group = classified['RecallGroup'].tolist()
+    recall_subgroup = classified['RecallSubgroup'].tolist()
+
+    block = {
+        'RecallKey': recall_keys,
+        'RecallID': recall_ids,
+        'EventID': columns.pop('EventID', recall_ids),
+        'RecallDate': columns.pop('RecallDate'),
+        'Source': source,
+        'GeographyKey': columns.pop('GeographyKey'),
+        'OriginGeographyKey': columns.pop('OriginGeographyKey'),
+        'ClassificationKey': columns.pop('ClassificationKey'),
+        'ProductKey': columns.pop('ProductKey'),
+        'CompanyKey': columns.pop('CompanyKey'),
+        'DateKey': columns.pop('DateKey'),
+        'ReasonForRecall': columns.pop('ReasonForRecall'),
+        'RecallCategory': recall_category,
+        'RecallGroup': recall_group,
+        'RecallSubgroup': recall_subgroup,
+        'DistributionScope': columns.pop('DistributionScope'),
+        'ActionTaken': columns.pop('ActionTaken'),
+    }
+    for column, value in block.items():
+        if isinstance(value, (pd.Series, np.ndarray)):
+            block[column] = value.tolist()
+        elif not isinstance(value, list):
+            block[column] = [value] * n
+    return block
 
 
 def create_fact_recalls(
@@ -1486,247 +1732,189 @@ def create_fact_recalls(
     """
     logger.info("Creating fact_recalls...")
 
-    facts = []
-    recall_key = 1
-
-    # Process FDA records
-    for _, row in fda_df.iterrows():
-        # Parse date
-        date_val = parse_date(row.get('recall_initiation_date'))
-        if date_val is None:
-            date_val = parse_date(row.get('report_date'))
-
-        date_key = int(date_val.strftime('%Y%m%d')) if date_val else None
+    # Each source is built column-wise into a block of lists; the blocks are joined and turned
+    # into one DataFrame at the end, so dtypes are inferred the same way as from row records
 
-        # Recall Geography: USA + State
-        state = str(row.get('state', '')) if pd.notna(row.get('state')) else ''
-        geo_key = geo_map.get(f"USA|{state}", geo_map.get("USA|", 1))
+    # Hash each dimension map once; every source joins against the same index
+    geo_keys, class_keys, product_keys, company_keys = (
+        key_series(key_map) for key_map in (geo_map, class_map, product_map, company_map)
+    )
 
-        # Origin Geography: FDA country field (product origin)
-        origin_country = str(row.get('country', '')) if pd.notna(row.get('country')) else ''
-        origin_country_clean = harmonize_country_name(origin_country) if origin_country else None
-        if origin_country_clean == 'United States':
-            # For USA products, use the same geo key as recall (with state)
-            origin_geo_key = geo_key
+    # Product keys for all rows of a source at once, keyed the same way as in create_dim_product
+    def product_lookup(df, column, source, missing=None):
+        if column not in df.columns:
+            text = pd.Series('', index=df.index, dtype=object)
         else:
-            origin_geo_key = geo_map.get(origin_country_clean) if origin_country_clean else None
-
-        cls = str(row.get('classification', '')) if pd.notna(row.get('classification')) else ''
-        class_key = class_map.get(f"FDA|{cls}", 1)
-
-        desc = str(row.get('product_description', ''))[:200]
-        product_key = product_map.get(f"FDA|{desc}", 1)
+            text = df[column].astype(object).map(str).str.slice(0, 200)
+            if missing is not None:
+                text = text.where(df[column].notna(), missing)
+        return lookup_keys(product_keys, f"{source}|" + text, 1)
 
-        firm = str(row.get('recalling_firm', ''))[:200]
-        company_key = company_map.get(firm, 1)
-
-        # Classify recall reason
-        reason_text = str(row.get('reason_for_recall', ''))[:500] if pd.notna(row.get('reason_for_recall')) else None
-        recall_category, recall_group, recall_subgroup = classify_recall_reason(reason_text)
+    # Process FDA records
+    def fda_block(first_key):
+        # Parse date, falling back to report_date
+        dates = parse_dates(fda_df.get('recall_initiation_date', pd.Series(None, index=fda_df.index)))
+        missing_dates = dates.isna()
+        if missing_dates.any():
+            report_dates = fda_df.get('report_date', pd.Series(None, index=fda_df.index))
+            dates[missing_dates] = parse_dates(report_dates[missing_dates]).to_numpy()
 
-        facts.append({
-            'RecallKey': recall_key,
-            'RecallID': str(row.get('recall_number', f'FDA-{recall_key}')),
-            'EventID': str(row.get('event_id', '')) if pd.notna(row.get('event_id')) else None,  # FDA Event (groups multiple products)
-            'RecallDate': date_val,
-            'Source': 'FDA',
-            'GeographyKey': geo_key,
-            'OriginGeographyKey': origin_geo_key,
-            'ClassificationKey': class_key,
-            'ProductKey': product_key,
-            'CompanyKey': company_key,
-            'DateKey': date_key,
-            'ReasonForRecall': reason_text,
-            'RecallCategory': recall_category,
-            'RecallGroup': recall_group,
-            'RecallSubgroup': recall_subgroup,
-            'DistributionScope': str(row.get('distribution_pattern', ''))[:200] if pd.notna(row.get('distribution_pattern')) else None,
-            'ActionTaken': None
-        })
-        recall_key += 1
+        # Recall Geography: USA + State
+        state = _optional_text_column(fda_df, 'state', missing='')
+        geo_key = lookup_keys(geo_keys, 'USA|' + state, geo_map.get("USA|", 1))
 
-    logger.info(f"Processed {len(fda_df)} FDA records")
+        # Origin Geography: FDA country field (product origin)
+        origin_country_clean = harmonize_country_series(_optional_text_column(fda_df, 'country', missing=''))
+        origin_geo_key = lookup_keys(geo_keys, origin_country_clean, None)
+        # For USA products, use the same geo key as recall (with state)
+        is_usa = (origin_country_clean == 'United States').to_numpy()
+        origin_geo_key[is_usa] = geo_key[is_usa]
+
+        cls = _optional_text_column(fda_df, 'classification', missing='')
+        firm = _text_column(fda_df, 'recalling_firm').str.slice(0, 200)
+
+        return _fact_block(
+            'FDA', fda_df, first_key, 'recall_number',
+            EventID=_optional_text_column(fda_df, 'event_id'),  # FDA Event (groups multiple products)
+            RecallDate=_date_values(dates),
+            GeographyKey=geo_key,
+            OriginGeographyKey=origin_geo_key,
+            ClassificationKey=lookup_keys(class_keys, 'FDA|' + cls, 1),
+            ProductKey=product_lookup(fda_df, 'product_description', 'FDA'),
+            CompanyKey=lookup_keys(company_keys, firm, 1),
+            DateKey=_date_keys(dates),
+            ReasonForRecall=_optional_text_column(fda_df, 'reason_for_recall', length=500).tolist(),
+            DistributionScope=_optional_text_column(fda_df, 'distribution_pattern', length=200),
+            ActionTaken=None
+        )
 
     # Process FSIS records
-    for _, row in fsis_df.iterrows():
-        # Parse date
-        date_val = parse_date(row.get('open_date'))
-        date_key = int(date_val.strftime('%Y%m%d')) if date_val else None
-
-        # Recall Geography: FSIS is USA only (no state info)
-        geo_key = geo_map.get("USA|", 1)
-
-        # Origin Geography: FSIS has no origin info
-        origin_geo_key = None
-
-        cls = str(row.get('class', '')) if pd.notna(row.get('class')) else ''
-        class_key = class_map.get(f"FSIS|{cls}", 1)
-
-        product = str(row.get('product', ''))[:200]
-        product_key = product_map.get(f"FSIS|{product}", 1)
-
-        # FSIS doesn't have company names in this dataset
-        company_key = 1
-
-        # Classify recall reason
-        reason_text = str(row.get('problem_type', ''))[:500] if pd.notna(row.get('problem_type')) else None
-        recall_category, recall_group, recall_subgroup = classify_recall_reason(reason_text)
-
-        facts.append({
-            'RecallKey': recall_key,
-            'RecallID': str(row.get('recall_number', f'FSIS-{recall_key}')),
-            'EventID': str(row.get('recall_number', f'FSIS-{recall_key}')),  # FSIS has no event hierarchy
-            'RecallDate': date_val,
-            'Source': 'FSIS',
-            'GeographyKey': geo_key,
-            'OriginGeographyKey': origin_geo_key,
-            'ClassificationKey': class_key,
-            'ProductKey': product_key,
-            'CompanyKey': company_key,
-            'DateKey': date_key,
-            'ReasonForRecall': reason_text,
-            'RecallCategory': recall_category,
-            'RecallGroup': recall_group,
-            'RecallSubgroup': recall_subgroup,
-            'DistributionScope': None,
-            'ActionTaken': None
-        })
-        recall_key += 1
-
-    logger.info(f"Processed {len(fsis_df)} FSIS records")
+    def fsis_block(first_key):
+        dates = parse_dates(fsis_df.get('open_date', pd.Series(None, index=fsis_df.index)))
+        cls = _optional_text_column(fsis_df, 'class', missing='')
+
+        return _fact_block(
+            'FSIS', fsis_df, first_key, 'recall_number',  # FSIS has no event hierarchy
+            RecallDate=_date_values(dates),
+            # Recall Geography: FSIS is USA only (no state info)
+            GeographyKey=geo_map.get("USA|", 1),
+            # Origin Geography: FSIS has no origin info
+            OriginGeographyKey=None,
+            ClassificationKey=lookup_keys(class_keys, 'FSIS|' + cls, 1),
+            ProductKey=product_lookup(fsis_df, 'product', 'FSIS'),
+            # FSIS doesn't have company names in this dataset
+            CompanyKey=1,
+            DateKey=_date_keys(dates),
+            ReasonForRecall=_optional_text_column(fsis_df, 'problem_type', length=500).tolist(),
+            DistributionScope=None,
+            ActionTaken=None
+        )
 
     # Process RASFF records
-    if rasff_df is not None and not rasff_df.empty:
-        for _, row in rasff_df.iterrows():
-            # Parse date - already converted to datetime in load_rasff_data
-            date_val = row.get('date')
-            if pd.notna(date_val):
-                if isinstance(date_val, str):
-                    date_val = pd.to_datetime(date_val, errors='coerce')
-                date_key = int(date_val.strftime('%Y%m%d')) if pd.notna(date_val) else None
-            else:
-                date_val = None
-                date_key = None
-
-            # Recall Geography: notifying_country (EU member that reported the issue)
-            notifying = str(row.get('notifying_country', '')) if pd.notna(row.get('notifying_country')) else ''
-            geo_key = geo_map.get(notifying, 1)
-
-            # Origin Geography: origin (where the product came from)
-            origin = str(row.get('origin', '')) if pd.notna(row.get('origin')) else ''
-            # Skip comma-separated lists (distribution data that leaked into origin)
-            if ',' in origin:
-                origin_geo_key = None
-            else:
-                origin_geo_key = geo_map.get(origin) if origin else None
-
-            # Get classification key based on notification type + risk decision
-            notif_type = str(row.get('classification', '')) if pd.notna(row.get('classification')) else 'unknown'
-            risk = str(row.get('risk_decision', '')) if pd.notna(row.get('risk_decision')) else 'unknown'
-            class_key = class_map.get(f"RASFF|{notif_type}|{risk}", 1)
-
-            # Get product key based on subject
-            subject = str(row.get('subject', ''))[:200] if pd.notna(row.get('subject')) else ''
-            product_key = product_map.get(f"RASFF|{subject}", 1)
-
+    def rasff_block(first_key):
+        # Date - already converted to datetime in load_rasff_data
+        dates = _loaded_dates(rasff_df)
+
+        # Recall Geography: notifying_country (EU member that reported the issue)
+        notifying = _optional_text_column(rasff_df, 'notifying_country', missing='')
+
+        # Origin Geography: origin (where the product came from)
+        origin = _optional_text_column(rasff_df, 'origin', missing='')
+        origin_geo_key = lookup_keys(geo_keys, origin, None)
+        # Skip comma-separated lists (distribution data that leaked into origin)
+        origin_geo_key[origin.str.contains(',', regex=False).to_numpy()] = None
+
+        # Classification key based on notification type + risk decision
+        notif_type = _optional_text_column(rasff_df, 'classification', missing='unknown')
+        risk = _optional_text_column(rasff_df, 'risk_decision', missing='unknown')
+
+        # Build reason from substance/hazard info
+        substance = _optional_text_column(rasff_df, 'substance', missing='')
+        hazard_cat = _optional_text_column(rasff_df, 'hazard_category', missing='')
+        reason = (substance + ' (' + hazard_cat + ')').where(substance != '', hazard_cat)
+        reason = reason.str.slice(0, 500).where(reason != '', None)
+
+        return _fact_block(
+            'RASFF', rasff_df, first_key, 'reference',  # RASFF reference is the event level
+            RecallDate=dates,
+            GeographyKey=lookup_keys(geo_keys, notifying, 1),
+            OriginGeographyKey=origin_geo_key,
+            ClassificationKey=lookup_keys(class_keys, 'RASFF|' + notif_type + '|' + risk, 1),
+            ProductKey=product_lookup(rasff_df, 'subject', 'RASFF', missing=''),
             # RASFF doesn't have company data in standard format
-            company_key = 1
-
-            # Build reason from substance/hazard info
-            substance = str(row.get('substance', '')) if pd.notna(row.get('substance')) else ''
-            hazard_cat = str(row.get('hazard_category', '')) if pd.notna(row.get('hazard_category')) else ''
-            reason = f"{substance} ({hazard_cat})" if substance else hazard_cat
-
-            # Classify recall reason
-            reason_for_classification = reason[:500] if reason else None
-            recall_category, recall_group, recall_subgroup = classify_recall_reason(reason_for_classification)
-
-            facts.append({
-                'RecallKey': recall_key,
-                'RecallID': str(row.get('reference', f'RASFF-{recall_key}')),
-                'EventID': str(row.get('reference', f'RASFF-{recall_key}')),  # RASFF reference is the event level
-                'RecallDate': date_val,
-                'Source': 'RASFF',
-                'GeographyKey': geo_key,
-                'OriginGeographyKey': origin_geo_key,
-                'ClassificationKey': class_key,
-                'ProductKey': product_key,
-                'CompanyKey': company_key,
-                'DateKey': date_key,
-                'ReasonForRecall': reason_for_classification,
-                'RecallCategory': recall_category,
-                'RecallGroup': recall_group,
-                'RecallSubgroup': recall_subgroup,
-                'DistributionScope': str(row.get('distribution', ''))[:200] if pd.notna(row.get('distribution')) else None,
-                'ActionTaken': str(row.get('action_taken', ''))[:200] if pd.notna(row.get('action_taken')) else None
-            })
-            recall_key += 1
-
-        logger.info(f"Processed {len(rasff_df)} RASFF records")
+            CompanyKey=1,
+            DateKey=_date_keys(dates),
+            ReasonForRecall=reason.tolist(),
+            DistributionScope=_optional_text_column(rasff_df, 'distribution', length=200),
+            ActionTaken=_optional_text_column(rasff_df, 'action_taken', length=200)
+        )
 
     # Process UK FSA records
-    if uk_fsa_df is not None and not uk_fsa_df.empty:
-        for _, row in uk_fsa_df.iterrows():
-            # Parse date - already converted to datetime in load_uk_fsa_data
-            date_val = row.get('date')
-            if pd.notna(date_val):
-                if isinstance(date_val, str):
-                    date_val = pd.to_datetime(date_val, errors='coerce')
-                date_key = int(date_val.strftime('%Y%m%d')) if pd.notna(date_val) else None
-            else:
-                date_val = None
-                date_key = None
-
+    def uk_fsa_block(first_key):
+        # Date - already converted to datetime in load_uk_fsa_data
+        dates = _loaded_dates(uk_fsa_df)
+
+        # Classification key based on alert type
+        alert_type = _optional_text_column(uk_fsa_df, 'alert_type', missing='Alert')
+
+        # Build reason from risk statement and allergens
+        risk_stmt = _optional_text_column(uk_fsa_df, 'risk_statement', missing='')
+        allergens = _optional_text_column(uk_fsa_df, 'allergens', missing='')
+        reason = risk_stmt.where(risk_stmt != '', ('Allergens: ' + allergens).where(allergens != '', ''))
+        reason = reason.str.slice(0, 500).where(reason != '', None)
+
+        return _fact_block(
+            'UK_FSA', uk_fsa_df, first_key, 'reference',  # UK_FSA has no event hierarchy
+            RecallDate=dates,
             # Recall Geography: UK is always United Kingdom
-            geo_key = geo_map.get("United Kingdom", 1)
-
+            GeographyKey=geo_map.get("United Kingdom", 1),
             # Origin Geography: UK FSA has no origin info
-            origin_geo_key = None
-
-            # Get classification key based on alert type
-            alert_type = str(row.get('alert_type', 'Alert')) if pd.notna(row.get('alert_type')) else 'Alert'
-            class_key = class_map.get(f"UK_FSA|{alert_type}", 1)
-
-            # Get product key based on product name
-            product_name = str(row.get('product_name', ''))[:200] if pd.notna(row.get('product_name')) else ''
-            product_key = product_map.get(f"UK_FSA|{product_name}", 1)
-
+            OriginGeographyKey=None,
+            ClassificationKey=lookup_keys(class_keys, 'UK_FSA|' + alert_type, 1),
+            ProductKey=product_lookup(uk_fsa_df, 'product_name', 'UK_FSA', missing=''),
             # UK FSA doesn't have company data
-            company_key = 1
-
-            # Build reason from risk statement and allergens
-            risk_stmt = str(row.get('risk_statement', '')) if pd.notna(row.get('risk_statement')) else ''
-            allergens = str(row.get('allergens', '')) if pd.notna(row.get('allergens')) else ''
-            reason = risk_stmt if risk_stmt else (f"Allergens: {allergens}" if allergens else None)
-
-            # Classify recall reason
-            reason_for_classification = reason[:500] if reason else None
-            recall_category, recall_group, recall_subgroup = classify_recall_reason(reason_for_classification)
-
-            facts.append({
-                'RecallKey': recall_key,
-                'RecallID': str(row.get('reference', f'UK_FSA-{recall_key}')),
-                'EventID': str(row.get('reference', f'UK_FSA-{recall_key}')),  # UK_FSA has no event hierarchy
-                'RecallDate': date_val,
-                'Source': 'UK_FSA',
-                'GeographyKey': geo_key,
-                'OriginGeographyKey': origin_geo_key,
-                'ClassificationKey': class_key,
-                'ProductKey': product_key,
-                'CompanyKey': company_key,
-                'DateKey': date_key,
-                'ReasonForRecall': reason_for_classification,
-                'RecallCategory': recall_category,
-                'RecallGroup': recall_group,
-                'RecallSubgroup': recall_subgroup,
-                'DistributionScope': str(row.get('countries', 'United Kingdom'))[:200],
-                'ActionTaken': None
-            })
-            recall_key += 1
-
-        logger.info(f"Processed {len(uk_fsa_df)} UK FSA records")
+            CompanyKey=1,
+            DateKey=_date_keys(dates),
+            ReasonForRecall=reason.tolist(),
+            DistributionScope=_text_column(uk_fsa_df, 'countries', default='United Kingdom').str.slice(0, 200),
+            ActionTaken=None
+        )
 
-    fact_recalls = pd.DataFrame(facts)
+    # Sources only share the read-only key indexes and the string kernels release the GIL, so the
+    # blocks are built side by side; RecallKeys are laid out in source order up front
+    parts = [
+        ('FDA', fda_block, len(fda_df)),
+        ('FSIS', fsis_block, len(fsis_df)),
+        ('RASFF', rasff_block, 0 if rasff_df is None or rasff_df.empty else len(rasff_df)),
+        ('UK FSA', uk_fsa_block, 0 if uk_fsa_df is None or uk_fsa_df.empty else len(uk_fsa_df)),
+    ]
+    first_keys = itertools.accumulate([1] + [row_count for _, _, row_count in parts])
+    with ThreadPoolExecutor(max_workers=len(parts)) as executor:
+        futures = [
+            executor.submit(build, first_key) if row_count else None
+            for (_, build, row_count), first_key in zip(parts, first_keys)
+        ]
+
+    blocks = []
+    for (label, _, row_count), future in zip(parts, futures):
+        if future is not None:
+            blocks.append(future.result())
+        logger.info(f"Processed {row_count} {label} records")
+
+    if blocks:
+        fact_recalls = pd.DataFrame({
+            column: list(itertools.chain.from_iterable(block[column] for block in blocks))
+            for column in blocks[0]
+        })
+        # Few distinct sources/classification labels across many recalls: store as categoricals
+        for column in ['Source', 'RecallCategory', 'RecallGroup', 'RecallSubgroup']:
+            fact_recalls[column] = fact_recalls[column].astype('category')
+        # Scope/action text only when it actually repeats (RASFF and UK values do, FDA patterns mostly don't)
+        for column in ['DistributionScope', 'ActionTaken']:
+            if 0 < fact_recalls[column].nunique() < 0.5 * len(fact_recalls):
+                fact_recalls[column] = fact_recalls[column].astype('category')
+    else:
+        fact_recalls = pd.DataFrame()
     logger.info(f"fact_recalls: {len(fact_recalls)} total rows created")
 
     return fact_recalls
@@ -1740,37 +1928,46 @@ def create_fact_health_impact(cdc_df: pd.DataFrame) -> pd.DataFrame:
         logger.warning("No CDC data available")
         return pd.DataFrame()
 
-    facts = []
-    impact_key = 1
-
-    for _, row in cdc_df.iterrows():
-        year = int(row.get('year', 0)) if pd.notna(row.get('year')) else None
-        month = int(row.get('month', 1)) if pd.notna(row.get('month')) else 1
-
-        # Create date key from year and month
-        if year:
-            date_key = int(f"{year}{month:02d}01")
-        else:
-            date_key = None
-
-        facts.append({
-            'HealthImpactKey': impact_key,
-            'OutbreakID': str(row.get('cdcid', f'CDC-{impact_key}')) if pd.notna(row.get('cdcid')) else f'CDC-{impact_key}',
-            'Year': year,
-            'Month': month,
-            'DateKey': date_key,
-            'State': str(row.get('state', '')) if pd.notna(row.get('state')) else None,
-            'Illnesses': int(row.get('illnesses', 0)) if pd.notna(row.get('illnesses')) else 0,
-            'Hospitalizations': int(row.get('hospitalizations', 0)) if pd.notna(row.get('hospitalizations')) else 0,
-            'Deaths': int(row.get('deaths', 0)) if pd.notna(row.get('deaths')) else 0,
-            'Pathogen': str(row.get('etiology', ''))[:200] if pd.notna(row.get('etiology')) else None,
-            'Serotype': str(row.get('serotype_or_genotype', ''))[:200] if pd.notna(row.get('serotype_or_genotype')) else None,
-            'FoodVehicle': str(row.get('food_vehicle', ''))[:200] if pd.notna(row.get('food_vehicle')) else None,
-            'IFSACCategory': str(row.get('ifsac_category', ''))[:200] if pd.notna(row.get('ifsac_category')) else None,
-            'Setting': str(row.get('setting', ''))[:200] if pd.notna(row.get('setting')) else None,
-            'PrimaryMode': str(row.get('primary_mode', ''))[:100] if pd.notna(row.get('primary_mode')) else None
-        })
-        impact_key += 1
+    n = len(cdc_df)
+    impact_keys = np.arange(1, n + 1)
+
+    # Numeric columns may arrive as JSON strings or nullable ints; absent columns read as missing
+    def numbers(column):
+        if column not in cdc_df.columns:
+            return pd.Series(np.nan, index=cdc_df.index)
+        return pd.to_numeric(cdc_df[column], errors='coerce')
+
+    year = numbers('year')
+    has_year = year.notna().to_numpy()
+    year_values = np.full(n, None, dtype=object)
+    year_values[has_year] = year[has_year].astype(np.int64).tolist()
+    month = numbers('month').fillna(1).astype(np.int64).to_numpy()
+
+    # Create date key from year and month (YYYYMM01); no key for a missing or zero year
+    date_keys = np.full(n, None, dtype=object)
+    dated = has_year & (year_values != 0)
+    date_keys[dated] = (year_values[dated].astype(np.int64) * 10000 + month[dated] * 100 + 1).tolist()
+
+    outbreak_ids = _optional_text_column(cdc_df, 'cdcid')
+    outbreak_ids = outbreak_ids.where(outbreak_ids.notna(), 'CDC-' + pd.Series(impact_keys, index=cdc_df.index).astype(str))
+
+    facts = {
+        'HealthImpactKey': impact_keys,
+        'OutbreakID': outbreak_ids.tolist(),
+        'Year': year_values.tolist(),
+        'Month': month,
+        'DateKey': date_keys.tolist(),
+        'State': _optional_text_column(cdc_df, 'state').tolist(),
+        'Illnesses': numbers('illnesses').fillna(0).astype(np.int64).to_numpy(),
+        'Hospitalizations': numbers('hospitalizations').fillna(0).astype(np.int64).to_numpy(),
+        'Deaths': numbers('deaths').fillna(0).astype(np.int64).to_numpy(),
+        'Pathogen': _optional_text_column(cdc_df, 'etiology', length=200).tolist(),
+        'Serotype': _optional_text_column(cdc_df, 'serotype_or_genotype', length=200).tolist(),
+        'FoodVehicle': _optional_text_column(cdc_df, 'food_vehicle', length=200).tolist(),
+        'IFSACCategory': _optional_text_column(cdc_df, 'ifsac_category', length=200).tolist(),
+        'Setting': _optional_text_column(cdc_df, 'setting', length=200).tolist(),
+        'PrimaryMode': _optional_text_column(cdc_df, 'primary_mode', length=100).tolist()
+    }
 
     fact_health_impact = pd.DataFrame(facts)
     logger.info(f"fact_health_impact: {len(fact_health_impact)} rows created")
@@ -1778,20 +1975,59 @@ def create_fact_health_impact(cdc_df: pd.DataFrame) -> pd.DataFrame:
     return fact_health_impact
 
 
-def save_to_parquet(df: pd.DataFrame, name: str, output_dir: Path):
+def load_all_sources() -> Dict[str, pd.DataFrame]:
+    """Run the independent source loaders concurrently (file reads and parsing overlap)."""
+    loaders = {
+        'fda': load_fda_data,
+        'fsis': load_fsis_data,
+        'cdc': load_cdc_data,
+        'rasff': load_rasff_data,
+        'uk_fsa': load_uk_fsa_data,
+    }
+    with ThreadPoolExecutor(max_workers=len(loaders)) as executor:
+        futures = {executor.submit(loader): name for name, loader in loaders.items()}
+        return {futures[future]: future.result() for future in as_completed(futures)}
+
+
+def save_to_parquet(df: pd.DataFrame, name: str, output_dir: Path, row_group_size: int = 131072):
     """Save DataFrame to Parquet file."""
     output_dir.mkdir(parents=True, exist_ok=True)
     filepath = output_dir / f"{name}.parquet"
 
-    # Convert object columns with mixed types to string
+    # Convert object columns with mixed types to string; text columns (object or str dtype)
+    # are handed to Arrow as-is, only the 'None'/'nan' placeholders are nulled like before
+    placeholders = ['None', 'nan']
     for col in df.columns:
-        if df[col].dtype == 'object':
-            df[col] = df[col].astype(str).replace('None', None).replace('nan', None)
-
-    df.to_parquet(filepath, index=False, engine='pyarrow')
+        column = df[col]
+        if isinstance(column.dtype, pd.CategoricalDtype):
+            found = column.cat.categories.intersection(placeholders)
+            if len(found):
+                df[col] = column.cat.remove_categories(found)
+        elif column.dtype == object or pd.api.types.is_string_dtype(column.dtype):
+            if column.dtype == object and pd.api.types.infer_dtype(column, skipna=True) != 'string':
+                column = column.astype(str)
+            df[col] = column.where(~column.isin(placeholders), None)
+
+    # zstd level 3 with dictionary-encoded text; 128k-row groups (by default) keep min/max
+    # statistics fine-grained enough for predicate pushdown on fact_recalls
+    df.to_parquet(
+        filepath, index=False, engine='pyarrow',
+        compression='zstd', compression_level=3, use_dictionary=True, row_group_size=row_group_size
+    )
     logger.info(f"Saved {name}: {len(df)} rows to {filepath}")
 
 
+def format_counts(counts: pd.Series, total: int = None) -> str:
+    """Render value_counts() output as indented lines, with shares of total if given."""
+    if total is None:
+        return "\n".join(f"  {value}: {count:,}" for value, count in counts.items())
+    shares = 100 * counts / total
+    return "\n".join(
+        f"  {value}: {count:,} ({share:.1f}%)"
+        for value, count, share in zip(counts.index, counts, shares)
+    )
+
+
 def main():
     """Main execution function."""
     logger.info("=" * 70)
@@ -1799,11 +2035,12 @@ def main():
     logger.info("=" * 70)
 
     # Load source data
-    fda_df = load_fda_data()
-    fsis_df = load_fsis_data()
-    cdc_df = load_cdc_data()
-    rasff_df = load_rasff_data()
-    uk_fsa_df = load_uk_fsa_data()
+    sources = load_all_sources()
+    fda_df = categorize_columns(sources['fda'])
+    fsis_df = categorize_columns(sources['fsis'])
+    cdc_df = sources['cdc']
+    rasff_df = categorize_columns(sources['rasff'])
+    uk_fsa_df = categorize_columns(sources['uk_fsa'])
 
     # Filter FDA for Food only (product_type = 'Food')
     if 'product_type' in fda_df.columns:
@@ -1826,17 +2063,23 @@ def main():
     )
     fact_health_impact = create_fact_health_impact(cdc_df)
 
-    # Save to Parquet
+    # Save to Parquet; Arrow encodes and compresses with the GIL released, so the tables are written side by side
     logger.info("\nSaving Star Schema to Parquet files...")
-    save_to_parquet(dim_date, 'dim_date', OUTPUT_DIR)
-    save_to_parquet(dim_geography, 'dim_geography', OUTPUT_DIR)
-    save_to_parquet(dim_classification, 'dim_classification', OUTPUT_DIR)
-    save_to_parquet(dim_product, 'dim_product', OUTPUT_DIR)
-    save_to_parquet(dim_company, 'dim_company', OUTPUT_DIR)
-    save_to_parquet(fact_recalls, 'fact_recalls', OUTPUT_DIR)
-
+    tables = {
+        'dim_date': dim_date,
+        'dim_geography': dim_geography,
+        'dim_classification': dim_classification,
+        'dim_product': dim_product,
+        'dim_company': dim_company,
+        'fact_recalls': fact_recalls,
+    }
     if not fact_health_impact.empty:
-        save_to_parquet(fact_health_impact, 'fact_health_impact', OUTPUT_DIR)
+        tables['fact_health_impact'] = fact_health_impact
+
+    with ThreadPoolExecutor(max_workers=len(tables)) as executor:
+        futures = [executor.submit(save_to_parquet, df, name, OUTPUT_DIR) for name, df in tables.items()]
+    for future in futures:
+        future.result()
 
     # Summary
     logger.info("\n" + "=" * 70)
@@ -1863,41 +2106,30 @@ def main():
     # Records by source in fact table
     if 'Source' in fact_recalls.columns:
         source_counts = fact_recalls['Source'].value_counts()
-        logger.info("\nRecords by Source in fact_recalls:")
-        for source, count in source_counts.items():
-            logger.info(f"  {source}: {count:,}")
+        logger.info("\nRecords by Source in fact_recalls:\n" + format_counts(source_counts))
 
     if 'RecallDate' in fact_recalls.columns:
         valid_dates = fact_recalls['RecallDate'].notna().sum()
         logger.info(f"\nRecords with valid dates: {valid_dates:,} ({100*valid_dates/len(fact_recalls):.1f}%)")
 
-    # Classification statistics
+    # Classification statistics, one log record per level
     if 'RecallCategory' in fact_recalls.columns:
         logger.info("\n" + "=" * 50)
         logger.info("RECALL CLASSIFICATION STATISTICS")
         logger.info("=" * 50)
 
         # Level 1: RecallCategory
-        logger.info("\nLevel 1 - RecallCategory:")
         cat_counts = fact_recalls['RecallCategory'].value_counts()
-        for cat, count in cat_counts.items():
-            pct = 100 * count / len(fact_recalls)
-            logger.info(f"  {cat}: {count:,} ({pct:.1f}%)")
+        logger.info("\nLevel 1 - RecallCategory:\n" + format_counts(cat_counts, len(fact_recalls)))
 
         # Level 2: RecallGroup
-        logger.info("\nLevel 2 - RecallGroup:")
-        group_counts = fact_recalls['RecallGroup'].value_counts()
-        for group, count in group_counts.head(15).items():
-            pct = 100 * count / len(fact_recalls)
-            logger.info(f"  {group}: {count:,} ({pct:.1f}%)")
+        group_counts = fact_recalls['RecallGroup'].value_counts().head(15)
+        logger.info("\nLevel 2 - RecallGroup:\n" + format_counts(group_counts, len(fact_recalls)))
 
         # Level 3: Top RecallSubgroups
-        logger.info("\nLevel 3 - Top RecallSubgroups:")
-        subgroup_counts = fact_recalls['RecallSubgroup'].dropna().value_counts()
-        for subgroup, count in subgroup_counts.head(15).items():
-            if subgroup and subgroup != 'None':
-                pct = 100 * count / len(fact_recalls)
-                logger.info(f"  {subgroup}: {count:,} ({pct:.1f}%)")
+        subgroup_counts = fact_recalls['RecallSubgroup'].dropna().value_counts().head(15)
+        subgroup_counts = subgroup_counts[~subgroup_counts.index.isin(['', 'None'])]
+        logger.info("\nLevel 3 - Top RecallSubgroups:\n" + format_counts(subgroup_counts, len(fact_recalls)))
 
         # Other (unclassified) rate
         other_count = (fact_recalls['RecallCategory'] == 'Other').sum()
@@ -2,6 +2,7 @@
 Upload Star Schema Parquet files to Azure Data Lake Gold layer.
 """
 import os
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from azure.storage.blob import BlobServiceClient
 from dotenv import load_dotenv
@@ -19,6 +20,10 @@ PROJECT_ROOT = Path(__file__).parent.parent.parent
 PARQUET_DIR = PROJECT_ROOT / "data" / "output" / "parquet"
 GOLD_PREFIX = "gold/"
 
+# Files uploaded side by side; each large file is also staged in parallel blocks
+MAX_WORKERS = 4
+BLOCK_CONCURRENCY = 8
+
 # Files to upload
 PARQUET_FILES = [
     "dim_date.parquet",
@@ -33,6 +38,25 @@ PARQUET_FILES = [
     "fact_adverse_events.parquet"
 ]
 
+def upload_file(container_client, filename: str) -> str:
+    """Upload one Parquet file to the Gold layer and return its status line."""
+    local_path = PARQUET_DIR / filename
+    blob_name = f"{GOLD_PREFIX}{filename}"
+
+    if not local_path.exists():
+        return f"SKIP: {filename} - Datei nicht gefunden"
+
+    blob_client = container_client.get_blob_client(blob_name)
+    size = local_path.stat().st_size
+
+    # Stream from disk; the SDK stages blocks of the file concurrently
+    with open(local_path, "rb") as f:
+        blob_client.upload_blob(f, overwrite=True, length=size, max_concurrency=BLOCK_CONCURRENCY)
+
+    file_size = size / 1024 / 1024  # MB
+    return f"Uploading: {filename}... OK ({file_size:.2f} MB)"
+
+
 def upload_parquets():
     print("Verbinde mit Azure Storage...")
     blob_service_client = BlobServiceClient.from_connection_string(CONNECTION_STRING)
@@ -41,23 +65,11 @@ def upload_parquets():
     print(f"\nUploading Star Schema files to {CONTAINER_NAME}/{GOLD_PREFIX}")
     print("-" * 50)
 
-    for filename in PARQUET_FILES:
-        local_path = PARQUET_DIR / filename
-        blob_name = f"{GOLD_PREFIX}{filename}"
-
-        if not local_path.exists():
-            print(f"SKIP: {filename} - Datei nicht gefunden")
-            continue
-
-        print(f"Uploading: {filename}...", end=" ")
-
-        blob_client = container_client.get_blob_client(blob_name)
-
-        with open(local_path, "rb") as f:
-            blob_client.upload_blob(f, overwrite=True)
-
-        file_size = local_path.stat().st_size / 1024 / 1024  # MB
-        print(f"OK ({file_size:.2f} MB)")
+    # Uploads are network-bound, so several files go up at once; status lines print in list order
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+        futures = [executor.submit(upload_file, container_client, filename) for filename in PARQUET_FILES]
+        for future in futures:
+            print(future.result())
 
     print("-" * 50)
     print("Upload abgeschlossen!")
@@ -1,3 +1,4 @@
+from .http import FullJitterRetry, create_session
 from .logger import setup_logger
 
-__all__ = ['setup_logger']
+__all__ = ['FullJitterRetry', 'create_session', 'setup_logger']
@@ -0,0 +1,42 @@
+import random
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+
+class FullJitterRetry(Retry):
+    """Retry with full jitter: sleep a random time up to the exponential backoff"""
+
+    def get_backoff_time(self):
+        return random.uniform(0, super().get_backoff_time())
+
+
+def create_session(pool_connections: int = 4, pool_maxsize: int = 10) -> requests.Session:
+    """
+    Create a pooled HTTPS session with jittered retries for the API fetchers.
+
+    Retries reuse the pooled keep-alive connection instead of re-handshaking TLS.
+    Retry-After from 429/503 responses takes precedence over the jittered backoff.
+
+    Args:
+        pool_connections: Number of host pools to cache
+        pool_maxsize: Maximum connections kept per host
+
+    Returns:
+        Configured requests session
+    """
+    session = requests.Session()
+    session.mount("https://", HTTPAdapter(
+        pool_connections=pool_connections,
+        pool_maxsize=pool_maxsize,
+        max_retries=FullJitterRetry(
+            total=3,
+            backoff_factor=1.0,
+            backoff_max=60,  # urllib3 >= 2
+            status_forcelist=[429, 500, 502, 503, 504],
+            allowed_methods=["GET"],
+            respect_retry_after_header=True
+        )
+    ))
+    return session
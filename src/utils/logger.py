@@ -21,6 +21,8 @@ def setup_logger(name: str = "fda_pipeline") -> logging.Logger:
         return logger
 
     logger.setLevel(logging.DEBUG)
+    # Own handlers below; don't also pass records to a root logger configured elsewhere
+    logger.propagate = False
 
     # Log format
     formatter = logging.Formatter(
@@ -6,21 +6,52 @@ import pandas as pd
 import re
 from pathlib import Path
 
-
-def clean_text_for_excel(text):
-    """Remove illegal characters that Excel/openpyxl cannot handle."""
-    if pd.isna(text):
-        return text
-    # Remove control characters (except tab, newline, carriage return)
-    text = str(text)
-    # Remove characters that openpyxl considers illegal (ASCII 0-8, 11-12, 14-31)
-    text = re.sub(r'[\x00-\x08\x0b\x0c\x0e-\x1f]', '', text)
-    return text
+try:
+    import xlsxwriter  # noqa: F401  (faster streaming writer than openpyxl)
+    EXCEL_ENGINE = 'xlsxwriter'
+except ImportError:  # fall back to openpyxl
+    EXCEL_ENGINE = 'openpyxl'
+
+# Characters that openpyxl considers illegal (ASCII 0-8, 11-12, 14-31)
+ILLEGAL_EXCEL_CHARS = re.compile(r'[\x00-\x08\x0b\x0c\x0e-\x1f]')
+
+
+def clean_text_for_excel(values):
+    """Remove illegal characters that Excel/openpyxl cannot handle from a column."""
+    # Remove control characters (except tab, newline, carriage return) in one
+    # vectorized pass; missing values are left as they are
+    if pd.api.types.is_string_dtype(values) and values.dtype != object:
+        return values.str.replace(ILLEGAL_EXCEL_CHARS.pattern, '', regex=True)
+    present = values.notna()
+    cleaned = values.astype(object)
+    cleaned[present] = values[present].astype(str).str.replace(ILLEGAL_EXCEL_CHARS.pattern, '', regex=True)
+    return cleaned
+
+
+def format_counts(counts, total):
+    """Render value_counts() output as indented 'value: count (pct%)' lines."""
+    shares = 100 * counts / total
+    return "\n".join(
+        f"  {value}: {count:,} ({share:.1f}%)"
+        for value, count, share in zip(counts.index, counts, shares)
+    )
+
+
+def summary_frame(level, counts, total):
+    """Turn value_counts() output into Level/Value/Count/Percentage rows."""
+    return pd.DataFrame({
+        'Level': level,
+        'Value': counts.index.astype(object),
+        'Count': counts.to_numpy(),
+        'Percentage': (100 * counts / total).map('{:.1f}%'.format).to_numpy(),
+    })
 
 # Paths
 PROJECT_ROOT = Path(__file__).parent.parent.parent
 PARQUET_FILE = PROJECT_ROOT / "data" / "output" / "parquet" / "fact_recalls.parquet"
 OUTPUT_FILE = PROJECT_ROOT / "data" / "output" / "classification" / "classification_review_v2.xlsx"
+# Columnar copy of the full review table, for filtering in pandas/Power BI instead of Excel
+OUTPUT_PARQUET = OUTPUT_FILE.with_suffix(".parquet")
 
 def export_classification_review():
     print("Loading fact_recalls.parquet...")
@@ -41,8 +72,8 @@ def export_classification_review():
     review_df = df[columns].copy()
 
     # Clean text columns for Excel compatibility
-    review_df['ReasonForRecall'] = review_df['ReasonForRecall'].apply(clean_text_for_excel)
-    review_df['RecallID'] = review_df['RecallID'].apply(clean_text_for_excel)
+    review_df['ReasonForRecall'] = clean_text_for_excel(review_df['ReasonForRecall'])
+    review_df['RecallID'] = clean_text_for_excel(review_df['RecallID'])
 
     # Sort by classification to group similar items
     review_df = review_df.sort_values(['RecallCategory', 'RecallGroup', 'RecallSubgroup', 'Source'])
@@ -52,17 +83,17 @@ def export_classification_review():
     print("CLASSIFICATION STATISTICS")
     print("=" * 50)
 
+    # Counts per level, computed once and reused for the Summary sheet
+    cat_counts = review_df['RecallCategory'].value_counts()
+    group_counts = review_df['RecallGroup'].value_counts()
+
     # Level 1
     print("\nLevel 1 - RecallCategory:")
-    for cat, count in review_df['RecallCategory'].value_counts().items():
-        pct = 100 * count / len(review_df)
-        print(f"  {cat}: {count:,} ({pct:.1f}%)")
+    print(format_counts(cat_counts, len(review_df)))
 
     # Level 2
     print("\nLevel 2 - RecallGroup (Top 15):")
-    for group, count in review_df['RecallGroup'].value_counts().head(15).items():
-        pct = 100 * count / len(review_df)
-        print(f"  {group}: {count:,} ({pct:.1f}%)")
+    print(format_counts(group_counts.head(15), len(review_df)))
 
     # Unknown records
     unknown_df = review_df[review_df['RecallCategory'] == 'Unknown']
@@ -74,42 +105,30 @@ def export_classification_review():
     # Export to Excel with multiple sheets
     print(f"\nExporting to {OUTPUT_FILE}...")
 
-    with pd.ExcelWriter(OUTPUT_FILE, engine='openpyxl') as writer:
+    # No constant_memory mode for xlsxwriter: pandas writes cells column by column,
+    # which that mode (row-at-a-time) cannot handle
+    with pd.ExcelWriter(OUTPUT_FILE, engine=EXCEL_ENGINE) as writer:
         # Sheet 1: All records
         review_df.to_excel(writer, sheet_name='All Records', index=False)
 
         # Sheet 2: Unknown only (for review)
         unknown_df.to_excel(writer, sheet_name='Unknown Only', index=False)
 
-        # Sheet 3: Summary statistics
-        summary_data = []
-
-        # Category counts
-        for cat, count in review_df['RecallCategory'].value_counts().items():
-            summary_data.append({
-                'Level': 'Category',
-                'Value': cat,
-                'Count': count,
-                'Percentage': f"{100*count/len(review_df):.1f}%"
-            })
-
-        # Group counts
-        for group, count in review_df['RecallGroup'].value_counts().items():
-            summary_data.append({
-                'Level': 'Group',
-                'Value': group,
-                'Count': count,
-                'Percentage': f"{100*count/len(review_df):.1f}%"
-            })
-
-        summary_df = pd.DataFrame(summary_data)
+        # Sheet 3: Summary statistics (category counts, then group counts)
+        summary_df = pd.concat([
+            summary_frame('Category', cat_counts, len(review_df)),
+            summary_frame('Group', group_counts, len(review_df)),
+        ], ignore_index=True)
         summary_df.to_excel(writer, sheet_name='Summary', index=False)
 
         # Sheet 4: By Source
-        source_cat = review_df.groupby(['Source', 'RecallCategory']).size().unstack(fill_value=0)
+        source_cat = review_df.groupby(['Source', 'RecallCategory'], observed=True).size().unstack(fill_value=0)
         source_cat.to_excel(writer, sheet_name='By Source')
 
+    review_df.to_parquet(OUTPUT_PARQUET, index=False)
+
     print(f"\nDone! Excel file saved to:\n{OUTPUT_FILE}")
+    print(f"All records also saved to:\n{OUTPUT_PARQUET}")
     print("\nSheets created:")
     print("  - All Records: Complete list sorted by classification")
     print("  - Unknown Only: Records with Unknown classification for review")
@@ -11,7 +11,9 @@ Validates:
 - Referential integrity
 """
 
+import functools
 import pandas as pd
+import pyarrow.parquet as pq
 from pathlib import Path
 import logging
 
@@ -27,13 +29,29 @@ PROJECT_ROOT = Path(__file__).parent.parent.parent
 PARQUET_DIR = PROJECT_ROOT / "data" / "output" / "parquet"
 
 
-def load_parquet(name: str) -> pd.DataFrame:
-    """Load a Parquet file."""
+@functools.lru_cache(maxsize=None)
+def _read_parquet(name: str, columns: tuple = None) -> pd.DataFrame:
+    """Read a Parquet file (only the given columns) once per run."""
     filepath = PARQUET_DIR / f"{name}.parquet"
     if not filepath.exists():
         logger.warning(f"File not found: {filepath}")
         return pd.DataFrame()
-    return pd.read_parquet(filepath)
+    return pd.read_parquet(filepath, columns=list(columns) if columns else None)
+
+
+def load_parquet(name: str, columns: list = None) -> pd.DataFrame:
+    """Load a Parquet file, reading only the listed columns if given."""
+    # Copy so checks that add or convert columns don't touch the cached frame
+    return _read_parquet(name, tuple(columns) if columns else None).copy()
+
+
+def parquet_row_count(name: str) -> int:
+    """Row count from the Parquet footer, without reading any column data."""
+    filepath = PARQUET_DIR / f"{name}.parquet"
+    if not filepath.exists():
+        logger.warning(f"File not found: {filepath}")
+        return 0
+    return pq.ParquetFile(filepath).metadata.num_rows
 
 
 def print_section(title: str):
@@ -48,25 +66,23 @@ def validate_record_counts():
     """Validate record counts per source."""
     print_section("1. RECORD COUNTS BY SOURCE")
 
-    fact_recalls = load_parquet("fact_recalls")
-    fact_health = load_parquet("fact_health_impact")
+    fact_recalls = load_parquet("fact_recalls", ['Source'])
+    fact_health_rows = parquet_row_count("fact_health_impact")
 
     if not fact_recalls.empty:
-        counts = fact_recalls.groupby('Source').size()
-        logger.info("Fact Recalls by Source:")
-        for source, count in counts.items():
-            logger.info(f"  {source}: {count:,}")
-        logger.info(f"  Total: {len(fact_recalls):,}")
+        counts = fact_recalls.groupby('Source', observed=True).size()
+        lines = [f"  {source}: {count:,}" for source, count in counts.items()]
+        logger.info("Fact Recalls by Source:\n" + "\n".join(lines) + f"\n  Total: {len(fact_recalls):,}")
 
-    if not fact_health.empty:
-        logger.info(f"\nFact Health Impact (CDC NORS): {len(fact_health):,}")
+    if fact_health_rows:
+        logger.info(f"\nFact Health Impact (CDC NORS): {fact_health_rows:,}")
 
 
 def validate_date_ranges():
     """Validate date ranges per source."""
     print_section("2. DATE RANGE VALIDATION")
 
-    fact_recalls = load_parquet("fact_recalls")
+    fact_recalls = load_parquet("fact_recalls", ['Source', 'RecallDate'])
 
     if not fact_recalls.empty and 'RecallDate' in fact_recalls.columns:
         fact_recalls['RecallDate'] = pd.to_datetime(fact_recalls['RecallDate'], errors='coerce')
@@ -86,8 +102,8 @@ def validate_classifications():
     """Validate classification distribution."""
     print_section("3. CLASSIFICATION DISTRIBUTION")
 
-    fact_recalls = load_parquet("fact_recalls")
-    dim_class = load_parquet("dim_classification")
+    fact_recalls = load_parquet("fact_recalls", ['Source', 'ClassificationKey'])
+    dim_class = load_parquet("dim_classification", ['ClassificationKey', 'Source', 'USAClassLevel', 'SeverityLevel'])
 
     if fact_recalls.empty or dim_class.empty:
         return
@@ -98,18 +114,19 @@ def validate_classifications():
         source_df = merged[merged['Source_x'] == source]
         class_counts = source_df.groupby(['USAClassLevel', 'SeverityLevel']).size()
 
-        logger.info(f"\n{source} Classification Distribution:")
-        for (class_level, severity), count in class_counts.items():
-            pct = 100 * count / len(source_df)
-            logger.info(f"  {class_level} ({severity}): {count:,} ({pct:.1f}%)")
+        lines = [
+            f"  {class_level} ({severity}): {count:,} ({100 * count / len(source_df):.1f}%)"
+            for (class_level, severity), count in class_counts.items()
+        ]
+        logger.info(f"\n{source} Classification Distribution:\n" + "\n".join(lines))
 
 
 def validate_geography():
     """Validate geographic distribution."""
     print_section("4. TOP STATES BY RECALL COUNT")
 
-    fact_recalls = load_parquet("fact_recalls")
-    dim_geo = load_parquet("dim_geography")
+    fact_recalls = load_parquet("fact_recalls", ['GeographyKey'])
+    dim_geo = load_parquet("dim_geography", ['GeographyKey', 'State'])
 
     if fact_recalls.empty or dim_geo.empty:
         return
@@ -118,24 +135,23 @@ def validate_geography():
     state_counts = merged[merged['State'].notna() & (merged['State'] != 'None')]\
         .groupby('State').size().sort_values(ascending=False).head(15)
 
-    logger.info("Top 15 States:")
-    for state, count in state_counts.items():
-        logger.info(f"  {state}: {count:,}")
+    lines = [f"  {state}: {count:,}" for state, count in state_counts.items()]
+    logger.info("Top 15 States:\n" + "\n".join(lines))
 
 
 def validate_yearly_distribution():
     """Validate yearly distribution."""
     print_section("5. YEARLY DISTRIBUTION")
 
-    fact_recalls = load_parquet("fact_recalls")
-    dim_date = load_parquet("dim_date")
+    fact_recalls = load_parquet("fact_recalls", ['DateKey', 'Source'])
+    dim_date = load_parquet("dim_date", ['DateKey', 'Year'])
 
     if fact_recalls.empty or dim_date.empty:
         return
 
     merged = fact_recalls.merge(dim_date, on='DateKey', how='left')
 
-    yearly = merged.groupby(['Year', 'Source']).size().unstack(fill_value=0)
+    yearly = merged.groupby(['Year', 'Source'], observed=True).size().unstack(fill_value=0)
     logger.info("\nRecalls by Year and Source:")
     logger.info(yearly.to_string())
 
@@ -144,8 +160,8 @@ def validate_product_categories():
     """Validate product category distribution."""
     print_section("6. TOP PRODUCT CATEGORIES")
 
-    fact_recalls = load_parquet("fact_recalls")
-    dim_product = load_parquet("dim_product")
+    fact_recalls = load_parquet("fact_recalls", ['ProductKey'])
+    dim_product = load_parquet("dim_product", ['ProductKey', 'ProductCategory'])
 
     if fact_recalls.empty or dim_product.empty:
         return
@@ -154,17 +170,16 @@ def validate_product_categories():
     cat_counts = merged[merged['ProductCategory'].notna() & (merged['ProductCategory'] != 'None')]\
         .groupby('ProductCategory').size().sort_values(ascending=False).head(15)
 
-    logger.info("Top 15 Product Categories:")
-    for cat, count in cat_counts.items():
-        pct = 100 * count / len(fact_recalls)
-        logger.info(f"  {cat}: {count:,} ({pct:.1f}%)")
+    lines = [f"  {cat}: {count:,} ({100 * count / len(fact_recalls):.1f}%)" for cat, count in cat_counts.items()]
+    logger.info("Top 15 Product Categories:\n" + "\n".join(lines))
 
 
 def validate_cdc_health_impact():
     """Validate CDC health impact data."""
     print_section("7. CDC NORS HEALTH IMPACT SUMMARY")
 
-    fact_health = load_parquet("fact_health_impact")
+    fact_health = load_parquet("fact_health_impact",
+                               ['HealthImpactKey', 'Year', 'Illnesses', 'Hospitalizations', 'Deaths'])
 
     if fact_health.empty:
         logger.warning("No CDC health impact data found")
@@ -191,7 +206,7 @@ def validate_data_quality():
     """Run data quality checks."""
     print_section("8. DATA QUALITY CHECKS")
 
-    fact_recalls = load_parquet("fact_recalls")
+    fact_recalls = load_parquet("fact_recalls", ['RecallID', 'RecallDate', 'Source', 'GeographyKey', 'ClassificationKey'])
 
     if fact_recalls.empty:
         return
@@ -206,18 +221,17 @@ def validate_data_quality():
         logger.info(f"  {col}: {total_missing:,} missing ({pct:.1f}%) [{status}]")
 
     # Check for orphan keys
-    dim_geo = load_parquet("dim_geography")
-    dim_class = load_parquet("dim_classification")
+    dim_geo = load_parquet("dim_geography", ['GeographyKey'])
+    dim_class = load_parquet("dim_classification", ['ClassificationKey'])
 
+    # Count orphans straight from the isin mask - no key set, no filtered frame
     if not dim_geo.empty:
-        geo_keys = set(dim_geo['GeographyKey'])
-        orphan_geo = fact_recalls[~fact_recalls['GeographyKey'].isin(geo_keys)]
-        logger.info(f"\nOrphan GeographyKeys: {len(orphan_geo)}")
+        orphan_geo = (~fact_recalls['GeographyKey'].isin(dim_geo['GeographyKey'])).sum()
+        logger.info(f"\nOrphan GeographyKeys: {orphan_geo}")
 
     if not dim_class.empty:
-        class_keys = set(dim_class['ClassificationKey'])
-        orphan_class = fact_recalls[~fact_recalls['ClassificationKey'].isin(class_keys)]
-        logger.info(f"Orphan ClassificationKeys: {len(orphan_class)}")
+        orphan_class = (~fact_recalls['ClassificationKey'].isin(dim_class['ClassificationKey'])).sum()
+        logger.info(f"Orphan ClassificationKeys: {orphan_class}")
 
 
 def generate_summary():
@@ -229,10 +243,9 @@ def generate_summary():
 
     logger.info("Table Sizes:")
     for table in tables:
-        df = load_parquet(table)
-        logger.info(f"  {table}: {len(df):,} rows")
+        logger.info(f"  {table}: {parquet_row_count(table):,} rows")
 
-    fact_recalls = load_parquet("fact_recalls")
+    fact_recalls = load_parquet("fact_recalls", ['RecallDate'])
     if not fact_recalls.empty:
         logger.info(f"\nDate Range: {fact_recalls['RecallDate'].min()} to {fact_recalls['RecallDate'].max()}")
 